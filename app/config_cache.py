@@ -0,0 +1,54 @@
+"""
+Cached Configuration Loader
+
+This module provides a process-wide cache for the parsed config.json.
+Both the application ConfigManager and the logger read the same file at
+startup; caching the parsed dict keyed by (path, st_mtime_ns) means the
+file is opened and parsed only once per process, and an edited file is
+picked up automatically on the next load because the mtime key changes.
+
+Functions:
+    load_cached: Return the parsed configuration dict for a path
+"""
+
+import functools
+import os
+from pathlib import Path
+
+from utils.json_fast import json_loads
+
+
+@functools.lru_cache(maxsize=8)
+def _load(path, mtime_ns):
+    """
+    Parse a JSON configuration file. Cached by (path, mtime_ns).
+
+    Args:
+        path (str): Absolute path to the JSON file.
+        mtime_ns (int): File modification time in nanoseconds, used only
+                        as part of the cache key for invalidation.
+
+    Returns:
+        dict: The parsed configuration.
+    """
+    # read_bytes is a single read syscall and json_loads parses bytes directly
+    return json_loads(Path(path).read_bytes())
+
+
+def load_cached(path):
+    """
+    Load a JSON configuration file through the mtime-keyed cache.
+
+    Args:
+        path: Path to the configuration file (str or Path).
+
+    Returns:
+        dict: The parsed configuration.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        json.JSONDecodeError: If the file contains invalid JSON.
+    """
+    path = os.fspath(path)
+    mtime_ns = os.stat(path).st_mtime_ns
+    return _load(path, mtime_ns)
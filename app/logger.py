@@ -1,8 +1,12 @@
 import logging
 import os
 import json
+import queue
 from pathlib import Path
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import TimedRotatingFileHandler, QueueHandler, QueueListener
+
+# Module directory, resolved once at import
+_HERE = Path(__file__).resolve().parent
 
 # Create logs directory if it doesn't exist
 LOG_DIR = "config/logs"
@@ -17,10 +21,9 @@ def get_log_level():
         Returns logging.INFO as default if any error occurs.
     """
     try:
-        config_path = Path(os.path.dirname(os.path.abspath(__file__))) / '../config/config.json'
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
-        
+        from app.config_cache import load_cached
+        config = load_cached(_HERE.parent / 'config' / 'config.json')
+
         log_level = config.get('general', {}).get('log_level', 'INFO').upper()
         
         # Validate log level
@@ -53,11 +56,18 @@ console_handler = logging.StreamHandler()
 console_handler.setLevel(LOG_LEVEL)
 console_handler.setFormatter(logging.Formatter("%(levelname)s - %(message)s"))
 
+# Move file/console I/O off the request threads: they only enqueue records,
+# a background listener thread does the writes and rotation checks
+log_queue = queue.SimpleQueue()
+queue_listener = QueueListener(
+    log_queue, file_handler, console_handler, respect_handler_level=True
+)
+queue_listener.start()
+
 # Configure global logger
 logger = logging.getLogger("Webhooks")
 logger.setLevel(LOG_LEVEL)
-logger.addHandler(file_handler)
-logger.addHandler(console_handler)
+logger.addHandler(QueueHandler(log_queue))
 
 logger.info(f"Logging file created in {os.getcwd()} {LOG_FILE}")
 logger.info(f"Logger initialized with level: {LOG_LEVEL}")
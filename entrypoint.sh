@@ -66,5 +66,6 @@ export MEDIAHOOK_HOST=${MEDIAHOOK_HOST:-0.0.0.0}
 
 echo "Starting MediaHook server on ${MEDIAHOOK_HOST}:${MEDIAHOOK_PORT}"
 
-# Start the application with 1 thread, tested OK with 20 queued requests (what I'm looking for)
-exec gunicorn -w 1 -b ${MEDIAHOOK_HOST}:${MEDIAHOOK_PORT} app.flask_app:app
+# Start the application with a single worker (keeps the in-memory Sonarr
+# buffer valid) and a thread pool so webhooks are handled in parallel
+exec gunicorn -w 1 -k gthread --threads 16 -b ${MEDIAHOOK_HOST}:${MEDIAHOOK_PORT} app.flask_app:app
@@ -1,7 +1,35 @@
 import json
 import re
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
 from app.logger import logger
+from utils.json_fast import json_loads
+
+# Year in parentheses at the end of a subject, e.g. "Title (2024)"
+_YEAR_RE = re.compile(r"\((\d{4})\)$")
+
+# Static notification templates, built once instead of per-webhook f-strings
+_MSG_TEMPLATE = ('<b>{title}</b>\n'
+                 ' <a href="{url}">{res_title}</a>\n'
+                 '      <b>Requested by:</b> <i>{user}</i>')
+_SEASONS_SUFFIX = '\n      <b>Seasons:</b> {seasons}'
+
+# notification_type -> (emoji, label) for the message title
+_OVERSEERR_DISPATCH = {
+    'MEDIA_AUTO_APPROVED': ('✅', 'Auto-approved request:'),
+    'MEDIA_APPROVED': ('✅', 'Request approved:'),
+    'MEDIA_DECLINED': ('❌', 'Request declined:'),
+    'MEDIA_PENDING': ('🕘', 'Request pending:'),
+}
+
+# Process-wide cache of TMDb localized titles.
+# Maps (media_type, tmdb_id, language) -> (localized title or None, expiry).
+_TMDB_TITLE_CACHE = {}
+_TMDB_TITLE_CACHE_LOCK = threading.Lock()
+_TMDB_TITLE_CACHE_MAX = 1024
+_TMDB_TITLE_TTL = 86400  # Localized titles are effectively static, keep for a day
 
 class OverseerrLogic:
     """
@@ -21,6 +49,16 @@ class OverseerrLogic:
         self.app_config = app_config
         self.tmdb_api_key = app_config.tmdb.api_key
         self.tmdb_language = app_config.tmdb.language
+
+        # Pooled session so TMDb lookups reuse TLS connections across webhooks
+        self.session = requests.Session()
+        self.session.headers.update({'Accept': 'application/json'})
+        self.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+        # Single notifier instance reused for every webhook
+        # Import here to avoid circular imports
+        from utils.telegram_notifier import TelegramNotifier
+        self.telegram_notifier = TelegramNotifier(app_config)
     
     def clean_year(self, subject):
         """
@@ -32,7 +70,7 @@ class OverseerrLogic:
         Returns:
             str: The year if found, empty string otherwise.
         """
-        match = re.search(r"\((\d{4})\)$", subject)  # Search for year at end of string in parentheses
+        match = _YEAR_RE.search(subject)  # Search for year at end of string in parentheses
         return match.group(1) if match else ""  # Return year or ""
     
     def get_spanish_title(self, tmdb_id, original, media_type):
@@ -49,21 +87,34 @@ class OverseerrLogic:
         """
         if not tmdb_id or not self.tmdb_api_key:
             return original
-        
+
+        cache_key = (media_type, tmdb_id, self.tmdb_language)
+        now = time.monotonic()
+        with _TMDB_TITLE_CACHE_LOCK:
+            cached = _TMDB_TITLE_CACHE.get(cache_key)
+        if cached is not None and cached[1] > now:
+            localized = cached[0]
+            logger.debug(f"TMDb title cache hit for {cache_key}")
+            return f'{localized} ({self.clean_year(original)})' if localized else original
+
         try:
-            tmdb_url = f"https://api.themoviedb.org/3/{media_type}/{tmdb_id}?api_key={self.tmdb_api_key}&language={self.tmdb_language}"
-            response = requests.get(tmdb_url)
+            tmdb_url = f"https://api.themoviedb.org/3/{media_type}/{tmdb_id}"
+            params = {'api_key': self.tmdb_api_key, 'language': self.tmdb_language}
+            response = self.session.get(tmdb_url, params=params, timeout=(3, 5))
             response.raise_for_status()
-            tmdb_data = response.json()
-            
-            logger.info(tmdb_data)
-            
-            if "name" in tmdb_data:
-                return f'{tmdb_data["name"]} ({self.clean_year(original)})'
-            elif "title" in tmdb_data:
-                return f'{tmdb_data["title"]} ({self.clean_year(original)})'
-            else:
-                return original
+            tmdb_data = json_loads(response.content)
+
+            logger.debug(tmdb_data)
+
+            localized = tmdb_data.get("name") or tmdb_data.get("title")
+            with _TMDB_TITLE_CACHE_LOCK:
+                if len(_TMDB_TITLE_CACHE) >= _TMDB_TITLE_CACHE_MAX:
+                    _TMDB_TITLE_CACHE.clear()  # Crude but rarely reached eviction
+                _TMDB_TITLE_CACHE[cache_key] = (localized, now + _TMDB_TITLE_TTL)
+
+            if localized:
+                return f'{localized} ({self.clean_year(original)})'
+            return original
         except requests.RequestException as e:
             logger.warning(f"Error getting localized title from TMDb: {e}")
             return original
@@ -76,28 +127,19 @@ class OverseerrLogic:
             event (dict): Webhook event data from Overseerr.
         """
         notification_type = event.get("notification_type", "")
-        
+
         if notification_type == 'TEST_NOTIFICATION':
             logger.info("Received test webhook from Overseerr...")
-        
-        elif notification_type == 'MEDIA_AUTO_APPROVED':
-            stat_4k = "4K - " if event["media"]["status4k"] == "PENDING" else ""
-            self.format_message(event, f"✅  {stat_4k}Auto-approved request:")
-        
-        elif notification_type == 'MEDIA_APPROVED':
-            stat_4k = "4K - " if event["media"]["status4k"] == "PENDING" else ""
-            self.format_message(event, f"✅  {stat_4k}Request approved:")
-        
-        elif notification_type == 'MEDIA_DECLINED':
-            stat_4k = "4K - " if event["media"]["status4k"] == "PENDING" else ""
-            self.format_message(event, f"❌  {stat_4k}Request declined:")
-        
-        elif notification_type == 'MEDIA_PENDING':
-            stat_4k = "4K - " if event["media"]["status4k"] == "PENDING" else ""
-            self.format_message(event, f"🕘  {stat_4k}Request pending:")
-        
-        else:
+            return
+
+        entry = _OVERSEERR_DISPATCH.get(notification_type)
+        if entry is None:
             logger.error(f"Unknown overseerr webhook: {json.dumps(event, indent=4)}")
+            return
+
+        emoji, label = entry
+        stat_4k = "4K - " if event["media"].get("status4k") == "PENDING" else ""
+        self.format_message(event, f"{emoji}  {stat_4k}{label}")
     
     def format_message(self, event, title):
         """
@@ -118,13 +160,12 @@ class OverseerrLogic:
             if len(event['extra']) > 0:
                 seasons = event['extra'][0].get('value', "")
         
-        res_message = (f"<b>{title}</b>\n"
-                      f" <a href=\"{url}\">{res_title}</a>\n"
-                      f"      <b>Requested by:</b> <i>{event['request']['requestedBy_username']}</i>")
-        
+        requested_by = event['request']['requestedBy_username']
+        res_message = _MSG_TEMPLATE.format_map({
+            'title': title, 'url': url, 'res_title': res_title, 'user': requested_by
+        })
+
         if seasons != "":
-            res_message += f"\n      <b>Seasons:</b> {seasons}"
-        
-        from utils.telegram_notifier import TelegramNotifier
-        telegram_notifier = TelegramNotifier(self.app_config)
-        telegram_notifier.send_image_message(res_message, event['image'])
+            res_message += _SEASONS_SUFFIX.format(seasons=seasons)
+
+        self.telegram_notifier.send_image_message(res_message, event['image'])
@@ -1,343 +1,603 @@
-import json
-import requests
-import langcodes
-from collections import defaultdict
-from app.logger import logger
-from utils.utils import exit_with_error, bytes_to_gb, clean_title
-
-class RadarrLogic:
-    """
-    Class for handling Radarr business logic.
-    
-    This class manages all interactions with Radarr instances, including
-    movie downloads, disk space management, quality upgrades, and
-    automated movie deletion for space management.
-    """
-    
-    def __init__(self, app_config):
-        """
-        Initialize RadarrLogic with application configuration.
-        
-        Args:
-            app_config: Application configuration containing Radarr instances
-                       and other service configurations.
-        """
-        self.app_config = app_config
-        self.radarr_instances = app_config.radarr_instances
-        self.tmdb_api_key = app_config.tmdb.api_key
-        self.tmdb_language = app_config.tmdb.language
-        self.display_language = app_config.tmdb.display_language
-        self.imdb_language = app_config.imdb.language
-        
-        # Use the first instance as default (can be expanded for multiple instances)
-        if self.radarr_instances:
-            self.primary_instance = self.radarr_instances[0]
-        else:
-            logger.error("No Radarr instances configured")
-            exit_with_error("No Radarr instances configured")
-    
-    def get_disk_space(self, instance=None):
-        """
-        Get free disk space where Radarr movies are stored.
-        
-        Args:
-            instance: Radarr instance to check. Uses primary instance if None.
-            
-        Returns:
-            int: Free space in bytes.
-            
-        Raises:
-            SystemExit: If the configured hard drive route is not found.
-        """
-        if instance is None:
-            instance = self.primary_instance
-            
-        diskspace_url = f"{instance.api_url}/api/v3/diskspace"
-        logger.debug(f"Obtaining disk space from GET {diskspace_url}")
-        
-        try:
-            response = requests.get(diskspace_url, headers=instance.headers)
-            response.raise_for_status()
-            disk_data = response.json()
-            
-            logger.debug(f"Response from GET {json.dumps(disk_data, indent=4)}")
-            
-            for disk in disk_data:
-                if instance.hard_drive_route == disk['path']:
-                    logger.debug(f'{instance.hard_drive_route} has {bytes_to_gb(disk["freeSpace"])} GB'
-                               f' out of {bytes_to_gb(disk["totalSpace"])} GB')
-                    return disk['freeSpace']
-            
-            exit_with_error(f'{instance.hard_drive_route} route not found')
-            
-        except requests.RequestException as e:
-            logger.error(f"Error getting disk space from Radarr: {e}")
-            exit_with_error(f"Failed to get disk space from Radarr: {e}")
-    
-    def parse_language(self, language_list, is_subtitle=False):
-        """
-        Convert language codes to full language names in the configured language.
-        
-        Args:
-            language_list (list): List of language codes to parse.
-            is_subtitle (bool): Whether these languages are for subtitles.
-            
-        Returns:
-            str: Comma-separated language names in configured display language.
-        """
-        if language_list:
-            full_lang = []
-            for lang_code in language_list:
-                try:
-                    full_lang.append(langcodes.Language.get(lang_code).display_name(self.display_language))
-                except Exception as e:
-                    logger.warning(f"Error parsing language code {lang_code}: {e}")
-                    full_lang.append(lang_code)
-            res = ', '.join(full_lang)
-            return res.title()
-        else:
-            return "None" if is_subtitle else "Unknown"
-    
-    def get_spanish_title(self, tmdb_id, original):
-        """
-        Get the localized title of a movie from TMDb if available.
-        
-        Args:
-            tmdb_id (int): TMDb ID of the movie.
-            original (str): Original title to use as fallback.
-            
-        Returns:
-            str: Localized title if available, otherwise original title.
-        """
-        if not tmdb_id or not self.tmdb_api_key:
-            logger.debug("TMDb ID of the content or API key not available, using original title.")
-            return original
-        
-        try:
-            tmdb_url = f"https://api.themoviedb.org/3/movie/{tmdb_id}?api_key={self.tmdb_api_key}&language={self.tmdb_language}"
-            response = requests.get(tmdb_url)
-            response.raise_for_status()
-            tmdb_data = response.json()
-            
-            return tmdb_data.get("title", original)  # Return localized title if available
-        except requests.RequestException as e:
-            logger.warning(f"Error getting localized title from TMDb: {e}")
-            return original
-    
-    def get_no_delete_tag_id(self, instance=None):
-        """
-        Get the ID of the 'no_delete' tag in Radarr.
-        
-        Args:
-            instance: Radarr instance to check. Uses primary instance if None.
-            
-        Returns:
-            int: ID of the 'no_delete' tag.
-            
-        Raises:
-            SystemExit: If the 'no_delete' tag is not found.
-        """
-        if instance is None:
-            instance = self.primary_instance
-            
-        tag_url = f"{instance.api_url}/api/v3/tag"
-        logger.debug(f"Obtaining ID tag from GET {tag_url}")
-        
-        try:
-            response = requests.get(tag_url, headers=instance.headers)
-            response.raise_for_status()
-            tags = response.json()
-            
-            logger.debug(f"Response from GET {json.dumps(tags, indent=4)}")
-            
-            for tag in tags:
-                if tag["label"].lower() == "no_delete":
-                    logger.debug(f"no_delete tag id: {tag['id']}")
-                    return tag["id"]
-            
-            exit_with_error(f'{tag_url} no_delete tag not found')
-            
-        except requests.RequestException as e:
-            logger.error(f"Error getting tags from Radarr: {e}")
-            exit_with_error(f"Failed to get tags from Radarr: {e}")
-    
-    def get_movies_without_no_delete_tag(self, instance=None):
-        """
-        Get all Radarr movies without the 'no_delete' tag.
-        
-        Args:
-            instance: Radarr instance to check. Uses primary instance if None.
-            
-        Returns:
-            list: List of movies that don't have the 'no_delete' tag.
-        """
-        if instance is None:
-            instance = self.primary_instance
-            
-        movies_url = f"{instance.api_url}/api/v3/movie"
-        logger.debug(f"Calling GET {movies_url}")
-        
-        try:
-            response = requests.get(movies_url, headers=instance.headers)
-            response.raise_for_status()
-            movies = response.json()
-            
-            logger.debug(f"Response from GET {response.status_code}")
-            
-            tag_id = self.get_no_delete_tag_id(instance)
-            # Filter movies without the 'no_delete' tag
-            filtered_movies = [p for p in movies if tag_id not in p["tags"]]
-            logger.debug(f"Found {len(filtered_movies)} movies without 'no_delete' tag")
-            
-            return filtered_movies
-            
-        except requests.RequestException as e:
-            logger.error(f"Error getting movies from Radarr: {e}")
-            exit_with_error(f"Failed to get movies from Radarr: {e}")
-    
-    def delete_movies(self, movies_to_delete):
-        """
-        Delete selected movies from Radarr.
-        
-        Args:
-            movies_to_delete (list): List of movie IDs to delete.
-        """
-        from utils.delete_manual_import import DeleteManualImportManager
-        from utils.telegram_notifier import res_actions_send
-        
-        instance = self.primary_instance
-        res_actions_del = []
-        res_actions_nodel = []
-        
-        # Check dry_run mode
-        dry_run = self.app_config.general.get('dry_run', True)
-        if dry_run:
-            logger.info("🔍 DRY RUN MODE: Movies will not be actually deleted from Radarr")
-        
-        # Initialize the manual import manager
-        manual_import_manager = DeleteManualImportManager(self.app_config)
-        
-        for movie_id in movies_to_delete:
-            res_actions_del_add, res_actions_nodel_add = manual_import_manager.process_item('radarr', movie_id)
-            res_actions_del.extend(res_actions_del_add)
-            res_actions_nodel.extend(res_actions_nodel_add)
-            
-            if dry_run:
-                logger.info(f"🔍 DRY RUN: Would delete movie id {movie_id} from Radarr")
-            else:
-                try:
-                    response = requests.delete(
-                        f"{instance.api_url}/api/v3/movie/{movie_id}?deleteFiles=true", 
-                        headers=instance.headers
-                    )
-                    logger.info(f"Deleting movie id {movie_id}: "
-                              f"{instance.api_url}/api/v3/movie/{movie_id}?deleteFiles=true: "
-                              f"STATUS {response.status_code}")
-                except requests.RequestException as e:
-                    logger.error(f"Error deleting movie {movie_id}: {e}")
-        
-        logger.info(json.dumps(res_actions_del, indent=4))
-        logger.info(json.dumps(res_actions_nodel, indent=4))
-        res_actions_send(res_actions_del, res_actions_nodel)
-    
-    def get_poster(self, movie_images):
-        """
-        Extract the poster URL from a movie's images.
-        
-        Args:
-            movie_images (list): List of image objects for the movie.
-            
-        Returns:
-            str or None: URL of the poster image, or None if not found.
-        """
-        for image in movie_images:
-            if image["coverType"] == "poster":
-                return image["remoteUrl"]
-        return None
-    
-    def process_event(self, event):
-        """
-        Process a Radarr webhook and manage movie deletion.
-        
-        Args:
-            event (dict): Webhook event data from Radarr.
-        """
-        logger.debug(f"Processing radarr event [{event.get('eventType', '')}]")
-        
-        if event.get("eventType", "") != "Download":
-            logger.warning(f"Event not Download/Upgrade, not processed : [{event.get('eventType', '')}]")
-            return
-        
-        is_upgrade = event.get("isUpgrade", False)
-        
-        # Imported movie data
-        movie_id = event["movie"]["id"]
-        movie_year = event["movie"]["year"]
-        movie_size = event["movieFile"]["size"]
-        movie_imdb_id = event["movie"]["imdbId"]
-        movie_quality = event["movieFile"]["quality"]
-        movie_poster = self.get_poster(event["movie"]["images"])  # If no poster = None
-        movie_title = self.get_spanish_title(event["movie"]["tmdbId"], event["movie"]["title"])
-        
-        # Get imported movie details (audio/subtitle languages)
-        audio_tracks = self.parse_language(event["movieFile"]["mediaInfo"]["audioLanguages"])
-        subtitles = self.parse_language(event["movieFile"]["mediaInfo"]["subtitles"], is_subtitle=True)
-        
-        # Notification structures
-        added_movie = {
-            "title": movie_title,
-            "year": movie_year,
-            "audio": audio_tracks,
-            "subtitles": subtitles,
-            "imdbUrl": f"https://www.imdb.com/{self.imdb_language}/title/{movie_imdb_id}",
-            "quality": movie_quality,
-            "poster": movie_poster
-        }
-        freed_space = 0
-        deleted_movies = []
-        
-        available_space = self.get_disk_space()
-        
-        if available_space > self.primary_instance.hard_drive_threshold:
-            logger.info(f"Sufficient disk space ({bytes_to_gb(available_space)} GB), "
-                       f"no movies will be deleted.")
-        else:
-            available_movies = self.get_movies_without_no_delete_tag()
-            available_movies = sorted(available_movies, key=lambda x: x["added"])
-            
-            movies_to_delete = []
-            
-            for movie in available_movies:
-                if freed_space >= movie_size:
-                    break
-                
-                movie_id_to_delete = movie["id"]
-                movie_title_to_delete = self.get_spanish_title(movie["tmdbId"], movie["title"])
-                movie_size_to_delete = movie.get("sizeOnDisk", 0)
-                movie_imdbid = movie["imdbId"]
-                movie_year_to_delete = movie["year"]
-                
-                freed_space += movie_size_to_delete
-                movies_to_delete.append(movie_id_to_delete)
-                
-                deleted_movies.append({
-                    "title": movie_title_to_delete,
-                    "year": movie_year_to_delete,
-                    "size": movie_size_to_delete,
-                    "imdbUrl": f"https://www.imdb.com/{self.imdb_language}/title/{movie_imdbid}"
-                })
-                logger.debug(f"Marking for deletion: {movie_title_to_delete} "
-                           f"({bytes_to_gb(movie_size_to_delete)} GB)")
-            
-            # Execute movie deletion
-            self.delete_movies(movies_to_delete)
-        
-        # Final notification with added and deleted movies
-        logger.info(f"Radarr message dict added movies: {json.dumps(added_movie, indent=4)}")
-        logger.info(f"Radarr message dict deleted movies: {json.dumps(deleted_movies, indent=4)}")
-        logger.info(f"Total space freed: {bytes_to_gb(freed_space)} GB")
-        
-        # Send notification to Telegram
-        from utils.telegram_notifier import TelegramNotifier
-        telegram_notifier = TelegramNotifier(self.app_config)
-        telegram_notifier.send_radarr_message(added_movie, deleted_movies, freed_space, is_upgrade)
+import heapq
+import logging
+import time
+import requests
+import langcodes
+from datetime import datetime
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter, Retry
+from app.logger import logger
+from utils.json_fast import json_loads, json_dumps
+from utils.tmdb_cache import title_cache
+from utils.utils import exit_with_error, bytes_to_gb, clean_title
+
+# Back-to-back webhooks reuse the same library listing within this window
+_MOVIE_LIST_TTL = 60
+
+# Free space barely moves between near-simultaneous webhooks; keep it briefly
+_DISK_SPACE_TTL = 5
+
+
+@dataclass(frozen=True, slots=True)
+class DeletedMovie:
+    """
+    Record of a movie removed to free disk space.
+
+    Attributes:
+        title (str): Localized title of the movie.
+        year: Release year of the movie.
+        size (int): Size on disk in bytes.
+        imdb_url (str): Link to the movie's IMDb page.
+    """
+    title: str
+    year: object
+    size: int
+    imdb_url: str
+
+    def to_dict(self):
+        """Return the dict shape the Telegram notifier expects."""
+        return {
+            "title": self.title,
+            "year": self.year,
+            "size": self.size,
+            "imdbUrl": self.imdb_url,
+        }
+
+
+@lru_cache(maxsize=256)
+def _display_name(lang_code, display_language):
+    """
+    Resolve a language code to its display name, memoized.
+
+    langcodes does non-trivial data lookups per call and the same handful
+    of codes repeats on every webhook, so cache the resolved names.
+
+    Args:
+        lang_code (str): Language code to resolve.
+        display_language (str): Language to render the name in.
+
+    Returns:
+        str: The display name for the code.
+    """
+    return langcodes.Language.get(lang_code).display_name(display_language)
+
+class RadarrLogic:
+    """
+    Class for handling Radarr business logic.
+    
+    This class manages all interactions with Radarr instances, including
+    movie downloads, disk space management, quality upgrades, and
+    automated movie deletion for space management.
+    """
+    
+    def __init__(self, app_config):
+        """
+        Initialize RadarrLogic with application configuration.
+        
+        Args:
+            app_config: Application configuration containing Radarr instances
+                       and other service configurations.
+        """
+        self.app_config = app_config
+        self.radarr_instances = app_config.radarr_instances
+        self.tmdb_api_key = app_config.tmdb.api_key
+        self.tmdb_language = app_config.tmdb.language
+        self.display_language = app_config.tmdb.display_language
+        self.imdb_language = app_config.imdb.language
+        # IMDb link prefix is constant for the process lifetime
+        self._imdb_url_prefix = f"https://www.imdb.com/{self.imdb_language}/title/"
+
+        # Shared session: keep-alive connections to Radarr and TMDb with retries
+        self.session = requests.Session()
+        # Radarr and TMDb both compress JSON when asked; the movie listing
+        # shrinks several-fold on the wire. Only advertise gzip: urllib3
+        # adds br by itself when a brotli decoder is installed, and forcing
+        # it without one would leave responses undecoded
+        self.session.headers.update({'Accept-Encoding': 'gzip'})
+        adapter = HTTPAdapter(
+            pool_connections=4, pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=(429, 500, 502, 503, 504))
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # Tags essentially never change during a process lifetime; cache the
+        # resolved 'no_delete' tag id per instance name
+        self._no_delete_tag_ids = {}
+
+        # Short-TTL cache of the full movie listing per instance name,
+        # as (movies, fetched_at); the library rarely changes between
+        # back-to-back webhooks and the transfer is tens of MB
+        self._movie_list_cache = {}
+
+        # Very short-TTL cache of free space per hard drive route,
+        # as (free_bytes, fetched_at)
+        self._disk_space_cache = {}
+
+        # Single notifier instance reused for every webhook, so duplicate
+        # suppression and per-chat pacing survive across events
+        # Import here to avoid circular imports
+        from utils.telegram_notifier import TelegramNotifier
+        self.telegram_notifier = TelegramNotifier(app_config)
+
+        # Use the first instance as default (can be expanded for multiple instances)
+        if self.radarr_instances:
+            self.primary_instance = self.radarr_instances[0]
+        else:
+            logger.error("No Radarr instances configured")
+            exit_with_error("No Radarr instances configured")
+    
+    def get_disk_space(self, instance=None):
+        """
+        Get free disk space where Radarr movies are stored.
+        
+        Args:
+            instance: Radarr instance to check. Uses primary instance if None.
+            
+        Returns:
+            int: Free space in bytes.
+            
+        Raises:
+            SystemExit: If the configured hard drive route is not found.
+        """
+        if instance is None:
+            instance = self.primary_instance
+
+        cached = self._disk_space_cache.get(instance.hard_drive_route)
+        if cached is not None and time.monotonic() - cached[1] < _DISK_SPACE_TTL:
+            logger.debug(f"Using cached disk space for {instance.hard_drive_route}")
+            return cached[0]
+
+        diskspace_url = f"{instance.api_url}/api/v3/diskspace"
+        logger.debug(f"Obtaining disk space from GET {diskspace_url}")
+        
+        try:
+            response = self.session.get(diskspace_url, headers=instance.headers, timeout=(3, 10))
+            response.raise_for_status()
+            disk_data = json_loads(response.content)
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Response from GET {json_dumps(disk_data, indent=4)}")
+            
+            for disk in disk_data:
+                if instance.hard_drive_route == disk['path']:
+                    logger.debug(f'{instance.hard_drive_route} has {bytes_to_gb(disk["freeSpace"])} GB'
+                               f' out of {bytes_to_gb(disk["totalSpace"])} GB')
+                    self._disk_space_cache[instance.hard_drive_route] = (
+                        disk['freeSpace'], time.monotonic()
+                    )
+                    return disk['freeSpace']
+            
+            exit_with_error(f'{instance.hard_drive_route} route not found')
+            
+        except requests.RequestException as e:
+            logger.error(f"Error getting disk space from Radarr: {e}")
+            exit_with_error(f"Failed to get disk space from Radarr: {e}")
+    
+    def parse_language(self, language_list, is_subtitle=False):
+        """
+        Convert language codes to full language names in the configured language.
+        
+        Args:
+            language_list (list): List of language codes to parse.
+            is_subtitle (bool): Whether these languages are for subtitles.
+            
+        Returns:
+            str: Comma-separated language names in configured display language.
+        """
+        if language_list:
+            full_lang = []
+            for lang_code in language_list:
+                try:
+                    full_lang.append(_display_name(lang_code, self.display_language))
+                except Exception as e:
+                    logger.warning(f"Error parsing language code {lang_code}: {e}")
+                    full_lang.append(lang_code)
+            res = ', '.join(full_lang)
+            return res.title()
+        else:
+            return "None" if is_subtitle else "Unknown"
+    
+    def get_spanish_title(self, tmdb_id, original):
+        """
+        Get the localized title of a movie from TMDb if available.
+        
+        Args:
+            tmdb_id (int): TMDb ID of the movie.
+            original (str): Original title to use as fallback.
+            
+        Returns:
+            str: Localized title if available, otherwise original title.
+        """
+        if not tmdb_id or not self.tmdb_api_key:
+            logger.debug("TMDb ID of the content or API key not available, using original title.")
+            return original
+
+        cached = title_cache.get('movie', tmdb_id, self.tmdb_language)
+        if cached is not None:
+            return cached
+
+        try:
+            tmdb_url = f"https://api.themoviedb.org/3/movie/{tmdb_id}?api_key={self.tmdb_api_key}&language={self.tmdb_language}"
+            response = self.session.get(tmdb_url, timeout=(3, 10))
+            response.raise_for_status()
+            tmdb_data = json_loads(response.content)
+
+            if "title" in tmdb_data:
+                title_cache.set('movie', tmdb_id, self.tmdb_language, tmdb_data["title"])
+            return tmdb_data.get("title", original)  # Return localized title if available
+        except requests.RequestException as e:
+            logger.warning(f"Error getting localized title from TMDb: {e}")
+            return original
+    
+    def prefetch_titles(self, id_title_pairs):
+        """
+        Fetch localized titles for several movies concurrently.
+
+        The pooled session already keeps connections to TMDb alive, so a small
+        thread pool collapses N sequential round-trips into roughly one.
+
+        Args:
+            id_title_pairs (list): (tmdb_id, original_title) tuples.
+
+        Returns:
+            dict: Mapping tmdb_id -> localized title (or the original fallback).
+        """
+        unique = {}
+        for tmdb_id, original in id_title_pairs:
+            unique.setdefault(tmdb_id, original)
+
+        if not unique:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            titles = executor.map(
+                lambda item: self.get_spanish_title(item[0], item[1]),
+                unique.items()
+            )
+
+        return dict(zip(unique.keys(), titles))
+
+    def get_no_delete_tag_id(self, instance=None):
+        """
+        Get the ID of the 'no_delete' tag in Radarr.
+        
+        Args:
+            instance: Radarr instance to check. Uses primary instance if None.
+            
+        Returns:
+            int: ID of the 'no_delete' tag.
+            
+        Raises:
+            SystemExit: If the 'no_delete' tag is not found.
+        """
+        if instance is None:
+            instance = self.primary_instance
+
+        cached_id = self._no_delete_tag_ids.get(instance.name)
+        if cached_id is not None:
+            return cached_id
+
+        tag_url = f"{instance.api_url}/api/v3/tag"
+        logger.debug(f"Obtaining ID tag from GET {tag_url}")
+
+        try:
+            response = self.session.get(tag_url, headers=instance.headers, timeout=(3, 10))
+            response.raise_for_status()
+            tags = json_loads(response.content)
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Response from GET {json_dumps(tags, indent=4)}")
+
+            for tag in tags:
+                if tag["label"].lower() == "no_delete":
+                    logger.debug(f"no_delete tag id: {tag['id']}")
+                    self._no_delete_tag_ids[instance.name] = tag["id"]
+                    return tag["id"]
+
+            exit_with_error(f'{tag_url} no_delete tag not found')
+
+        except requests.RequestException as e:
+            logger.error(f"Error getting tags from Radarr: {e}")
+            exit_with_error(f"Failed to get tags from Radarr: {e}")
+
+    def clear_tag_cache(self):
+        """Forget memoized tag ids, forcing a re-fetch on next use."""
+        self._no_delete_tag_ids.clear()
+
+    def get_no_delete_movie_ids(self, instance=None):
+        """
+        Get the IDs of movies carrying the 'no_delete' tag.
+
+        Uses the tag detail endpoint, which returns the tagged movie IDs
+        directly, so filtering becomes one set-membership check per movie
+        instead of scanning each movie's tag list.
+
+        Args:
+            instance: Radarr instance to query. Uses primary instance if None.
+
+        Returns:
+            frozenset or None: Tagged movie IDs, or None if the detail
+                               endpoint could not be reached.
+        """
+        if instance is None:
+            instance = self.primary_instance
+
+        tag_id = self.get_no_delete_tag_id(instance)
+        detail_url = f"{instance.api_url}/api/v3/tag/detail/{tag_id}"
+        logger.debug(f"Obtaining tagged movie ids from GET {detail_url}")
+
+        try:
+            response = self.session.get(detail_url, headers=instance.headers, timeout=(3, 10))
+            response.raise_for_status()
+            detail = json_loads(response.content)
+            return frozenset(detail.get("movieIds", []))
+        except requests.RequestException as e:
+            logger.warning(f"Error getting tag detail from Radarr: {e}")
+            return None
+    
+    def get_movies_without_no_delete_tag(self, instance=None):
+        """
+        Get all Radarr movies without the 'no_delete' tag.
+        
+        Args:
+            instance: Radarr instance to check. Uses primary instance if None.
+            
+        Returns:
+            list: List of movies that don't have the 'no_delete' tag.
+        """
+        if instance is None:
+            instance = self.primary_instance
+
+        cached = self._movie_list_cache.get(instance.name)
+        if cached is not None and time.monotonic() - cached[1] < _MOVIE_LIST_TTL:
+            movies = cached[0]
+            logger.debug(f"Using cached movie listing for {instance.name} ({len(movies)} movies)")
+        else:
+            movies_url = f"{instance.api_url}/api/v3/movie"
+            logger.debug(f"Calling GET {movies_url}")
+
+            try:
+                response = self.session.get(movies_url, headers=instance.headers, timeout=(3, 10))
+                response.raise_for_status()
+                movies = json_loads(response.content)
+
+                logger.debug(f"Response from GET {response.status_code}")
+
+                # Project each movie down to the handful of fields the
+                # deletion pipeline reads; the full records carry dozens of
+                # keys each and would otherwise sit in the listing cache.
+                # The ISO 'added' date is parsed once here because integer
+                # epoch seconds compare much faster than strings during
+                # selection.
+                projected = []
+                for movie in movies:
+                    added = movie.get("added", "")
+                    try:
+                        added_ts = int(
+                            datetime.fromisoformat(added.replace("Z", "+00:00")).timestamp()
+                        )
+                    except ValueError:
+                        added_ts = 0
+                    projected.append({
+                        "id": movie["id"],
+                        "title": movie.get("title", ""),
+                        "year": movie.get("year", ""),
+                        "tmdbId": movie.get("tmdbId"),
+                        "imdbId": movie.get("imdbId", ""),
+                        "sizeOnDisk": movie.get("sizeOnDisk", 0),
+                        "tags": movie.get("tags", []),
+                        "_added_ts": added_ts,
+                    })
+                movies = projected
+
+                self._movie_list_cache[instance.name] = (movies, time.monotonic())
+
+            except requests.RequestException as e:
+                logger.error(f"Error getting movies from Radarr: {e}")
+                exit_with_error(f"Failed to get movies from Radarr: {e}")
+
+        # Filter movies without the 'no_delete' tag; prefer the tagged-id
+        # set from the detail endpoint, fall back to scanning tag lists
+        no_delete_ids = self.get_no_delete_movie_ids(instance)
+        if no_delete_ids is not None:
+            filtered_movies = [p for p in movies if p["id"] not in no_delete_ids]
+        else:
+            tag_id = self.get_no_delete_tag_id(instance)
+            filtered_movies = [p for p in movies if tag_id not in p["tags"]]
+        logger.debug(f"Found {len(filtered_movies)} movies without 'no_delete' tag")
+
+        return filtered_movies
+    
+    def _invalidate_movie_caches(self, instance):
+        """
+        Drop cached listings that a deletion has made stale
+
+        Args:
+            instance: Radarr instance whose movie list and disk space changed.
+        """
+        self._movie_list_cache.pop(instance.name, None)
+        self._disk_space_cache.pop(instance.hard_drive_route, None)
+
+    def delete_movies(self, movies_to_delete):
+        """
+        Delete selected movies from Radarr.
+        
+        Args:
+            movies_to_delete (list): List of movie IDs to delete.
+        """
+        from utils.delete_manual_import import DeleteManualImportManager
+        from utils.telegram_notifier import res_actions_send
+        
+        instance = self.primary_instance
+        res_actions_del = []
+        res_actions_nodel = []
+        
+        # Check dry_run mode (validated once at startup)
+        dry_run = self.app_config.dry_run
+        if dry_run:
+            logger.info("🔍 DRY RUN MODE: Movies will not be actually deleted from Radarr")
+        
+        # Initialize the manual import manager
+        manual_import_manager = DeleteManualImportManager(self.app_config)
+        
+        # Torrent cleanups are independent per movie and I/O-bound, run them
+        # concurrently instead of serially
+        if movies_to_delete:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = executor.map(
+                    lambda movie_id: manual_import_manager.process_item('radarr', movie_id),
+                    movies_to_delete
+                )
+            for res_actions_del_add, res_actions_nodel_add in results:
+                res_actions_del.extend(res_actions_del_add)
+                res_actions_nodel.extend(res_actions_nodel_add)
+
+        if dry_run:
+            for movie_id in movies_to_delete:
+                logger.info(f"🔍 DRY RUN: Would delete movie id {movie_id} from Radarr")
+        elif movies_to_delete:
+            # One bulk call to the editor endpoint instead of a DELETE per movie
+            try:
+                response = self.session.delete(
+                    f"{instance.api_url}/api/v3/movie/editor",
+                    headers=instance.headers,
+                    json={"movieIds": movies_to_delete, "deleteFiles": True},
+                    timeout=(3, 30)
+                )
+                logger.info(f"Bulk deleting {len(movies_to_delete)} movies "
+                          f"{movies_to_delete}: {instance.api_url}/api/v3/movie/editor: "
+                          f"STATUS {response.status_code}")
+                if response.ok:
+                    self._invalidate_movie_caches(instance)
+            except requests.RequestException as e:
+                logger.error(f"Error bulk deleting movies {movies_to_delete}: {e}")
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(json_dumps(res_actions_del, indent=4))
+            logger.info(json_dumps(res_actions_nodel, indent=4))
+        res_actions_send(res_actions_del, res_actions_nodel)
+    
+    def get_poster(self, movie_images):
+        """
+        Extract the poster URL from a movie's images.
+        
+        Args:
+            movie_images (list): List of image objects for the movie.
+            
+        Returns:
+            str or None: URL of the poster image, or None if not found.
+        """
+        return next(
+            (image["remoteUrl"] for image in movie_images if image["coverType"] == "poster"),
+            None
+        )
+    
+    def process_event(self, event):
+        """
+        Process a Radarr webhook and manage movie deletion.
+        
+        Args:
+            event (dict): Webhook event data from Radarr.
+        """
+        logger.debug(f"Processing radarr event [{event.get('eventType', '')}]")
+        
+        if event.get("eventType", "") != "Download":
+            logger.warning(f"Event not Download/Upgrade, not processed : [{event.get('eventType', '')}]")
+            return
+        
+        is_upgrade = event.get("isUpgrade", False)
+        
+        # Imported movie data
+        movie_id = event["movie"]["id"]
+        movie_year = event["movie"]["year"]
+        movie_size = event["movieFile"]["size"]
+        movie_imdb_id = event["movie"]["imdbId"]
+        movie_quality = event["movieFile"]["quality"]
+        movie_poster = self.get_poster(event["movie"]["images"])  # If no poster = None
+        movie_title = self.get_spanish_title(event["movie"]["tmdbId"], event["movie"]["title"])
+        
+        # Get imported movie details (audio/subtitle languages)
+        audio_tracks = self.parse_language(event["movieFile"]["mediaInfo"]["audioLanguages"])
+        subtitles = self.parse_language(event["movieFile"]["mediaInfo"]["subtitles"], is_subtitle=True)
+        
+        # Notification structures
+        added_movie = {
+            "title": movie_title,
+            "year": movie_year,
+            "audio": audio_tracks,
+            "subtitles": subtitles,
+            "imdbUrl": self._imdb_url_prefix + movie_imdb_id,
+            "quality": movie_quality,
+            "poster": movie_poster
+        }
+        freed_space = 0
+        deleted_movies = []
+        
+        available_space = self.get_disk_space()
+        
+        if available_space > self.primary_instance.hard_drive_threshold:
+            logger.info(f"Sufficient disk space ({bytes_to_gb(available_space)} GB), "
+                       f"no movies will be deleted.")
+        else:
+            available_movies = self.get_movies_without_no_delete_tag()
+
+            # Only the oldest handful of movies is ever deleted, so pop them
+            # lazily from a heap (O(N + k log N)) instead of sorting the whole
+            # library by date (O(N log N))
+            movie_heap = [
+                (movie.get("_added_ts", 0), index, movie)
+                for index, movie in enumerate(available_movies)
+            ]
+            heapq.heapify(movie_heap)
+
+            movies_to_delete = []
+            selected_movies = []
+            imdb_prefix = self._imdb_url_prefix
+
+            # Select candidates first; titles are only needed for
+            # notifications. The running total stops the scan as soon as
+            # enough space is covered, so only the popped prefix of the
+            # heap is ever touched.
+            heappop = heapq.heappop
+            while movie_heap and freed_space < movie_size:
+                _, _, movie = heappop(movie_heap)
+                freed_space += movie.get("sizeOnDisk", 0)
+                movies_to_delete.append(movie["id"])
+                selected_movies.append(movie)
+
+            # One concurrent batch instead of a TMDb round-trip per candidate
+            localized_titles = self.prefetch_titles(
+                [(movie["tmdbId"], movie["title"]) for movie in selected_movies]
+            )
+
+            for movie in selected_movies:
+                movie_title_to_delete = localized_titles.get(movie["tmdbId"], movie["title"])
+                movie_size_to_delete = movie.get("sizeOnDisk", 0)
+
+                deleted_movies.append(DeletedMovie(
+                    title=movie_title_to_delete,
+                    year=movie["year"],
+                    size=movie_size_to_delete,
+                    imdb_url=imdb_prefix + movie["imdbId"]
+                ))
+                logger.debug(f"Marking for deletion: {movie_title_to_delete} "
+                           f"({bytes_to_gb(movie_size_to_delete)} GB)")
+            
+            # Execute movie deletion
+            self.delete_movies(movies_to_delete)
+        
+        # The notifier and the log both want plain dicts; convert once here
+        deleted_movies = [movie.to_dict() for movie in deleted_movies]
+
+        # Final notification with added and deleted movies
+        logger.info(f"Radarr message dict added movies: {json_dumps(added_movie, indent=4)}")
+        logger.info(f"Radarr message dict deleted movies: {json_dumps(deleted_movies, indent=4)}")
+        logger.info(f"Total space freed: {bytes_to_gb(freed_space)} GB")
+        
+        # Send notification to Telegram
+        self.telegram_notifier.send_radarr_message(added_movie, deleted_movies, freed_space, is_upgrade)
@@ -1,422 +1,600 @@
-import json
-import requests
-from collections import defaultdict
-from app.logger import logger
-from utils.utils import bytes_to_gb, exit_with_error
-
-class SonarrLogic:
-    """
-    Class for handling Sonarr business logic.
-    
-    This class manages all interactions with Sonarr instances, including
-    webhooks processing, series management, disk space monitoring,
-    and automated quality upgrades.
-    """
-    
-    def __init__(self, app_config):
-        """
-        Initialize SonarrLogic with application configuration.
-        
-        Args:
-            app_config: Application configuration containing Sonarr instances
-                       and other service configurations.
-        """
-        self.app_config = app_config
-        self.sonarr_instances = app_config.sonarr_instances
-        self.tmdb_api_key = app_config.tmdb.api_key
-        self.tmdb_language = app_config.tmdb.language
-        self.imdb_language = app_config.imdb.language
-        
-        # Use the first instance as default (can be expanded for multiple instances)
-        if self.sonarr_instances:
-            self.primary_instance = self.sonarr_instances[0]
-        else:
-            logger.error("No Sonarr instances configured")
-            exit_with_error("No Sonarr instances configured")
-    
-    def get_disk_space(self, instance=None):
-        """
-        Get free disk space where Sonarr files are stored.
-        
-        Args:
-            instance: Sonarr instance to check. Uses primary instance if None.
-            
-        Returns:
-            int: Free space in bytes.
-            
-        Raises:
-            SystemExit: If the configured hard drive route is not found.
-        """
-        if instance is None:
-            instance = self.primary_instance
-            
-        diskspace_url = f"{instance.api_url}/api/v3/diskspace"
-        logger.debug(f"Obtaining disk space from GET {diskspace_url}")
-        
-        try:
-            response = requests.get(diskspace_url, headers=instance.headers)
-            response.raise_for_status()
-            disk_data = response.json()
-            
-            logger.debug(f"Response from GET {json.dumps(disk_data, indent=4)}")
-            
-            for disk in disk_data:
-                if instance.hard_drive_route == disk['path']:
-                    logger.debug(f'{instance.hard_drive_route} has {bytes_to_gb(disk["freeSpace"])} GB'
-                               f' out of {bytes_to_gb(disk["totalSpace"])} GB')
-                    return disk['freeSpace']
-            
-            exit_with_error(f'{instance.hard_drive_route} route not found')
-            
-        except requests.RequestException as e:
-            logger.error(f"Error getting disk space from Sonarr: {e}")
-            exit_with_error(f"Failed to get disk space from Sonarr: {e}")
-    
-    def get_no_delete_tag_id(self, instance=None):
-        """
-        Get the ID of the 'no_delete' tag in Sonarr.
-        
-        Args:
-            instance: Sonarr instance to check. Uses primary instance if None.
-            
-        Returns:
-            int: ID of the 'no_delete' tag.
-            
-        Raises:
-            SystemExit: If the 'no_delete' tag is not found.
-        """
-        if instance is None:
-            instance = self.primary_instance
-            
-        tag_url = f"{instance.api_url}/api/v3/tag"
-        logger.debug(f"Obtaining ID tag from GET {tag_url}")
-        
-        try:
-            response = requests.get(tag_url, headers=instance.headers)
-            response.raise_for_status()
-            tags = response.json()
-            
-            logger.debug(f"Response from GET {json.dumps(tags, indent=4)}")
-            
-            for tag in tags:
-                if tag["label"].lower() == "no_delete":
-                    logger.debug(f"no_delete tag id: {tag['id']}")
-                    return tag["id"]
-            
-            exit_with_error(f'{tag_url} no_delete tag not found')
-            
-        except requests.RequestException as e:
-            logger.error(f"Error getting tags from Sonarr: {e}")
-            exit_with_error(f"Failed to get tags from Sonarr: {e}")
-    
-    def get_series_without_no_delete_tag(self, tag_id, instance=None):
-        """
-        Get all Sonarr series without the 'no_delete' tag.
-        
-        Args:
-            tag_id (int): ID of the 'no_delete' tag to filter out.
-            instance: Sonarr instance to check. Uses primary instance if None.
-            
-        Returns:
-            list: List of series that don't have the 'no_delete' tag.
-        """
-        if instance is None:
-            instance = self.primary_instance
-            
-        series_url = f"{instance.api_url}/api/v3/series?includeSeasonImages=False"
-        logger.debug(f"Calling GET {series_url}")
-        
-        try:
-            response = requests.get(series_url, headers=instance.headers)
-            response.raise_for_status()
-            series = response.json()
-            
-            logger.debug(f"Response from GET {response.status_code} {len(series)} series")
-            
-            filtered_series = [serie for serie in series if tag_id not in serie["tags"]]
-            logger.debug(f"Filtered series {len(filtered_series)} series without 'no_delete' tag")
-            
-            return filtered_series
-            
-        except requests.RequestException as e:
-            logger.error(f"Error getting series from Sonarr: {e}")
-            exit_with_error(f"Failed to get series from Sonarr: {e}")
-    
-    def get_downloaded_episodes(self, series_id, instance=None):
-        """
-        Get downloaded episodes of a series and sort them by age.
-        
-        Args:
-            series_id (int): ID of the series in Sonarr.
-            instance: Sonarr instance to check. Uses primary instance if None.
-            
-        Returns:
-            list: List of downloaded episodes sorted by date, season, and episode number.
-        """
-        if instance is None:
-            instance = self.primary_instance
-            
-        episode_url = f"{instance.api_url}/api/v3/episode?seriesId={series_id}&includeEpisodeFile=true&includeSeries=false"
-        logger.debug(f"Calling GET {episode_url}")
-        
-        try:
-            response = requests.get(episode_url, headers=instance.headers)
-            response.raise_for_status()
-            episodes = response.json()
-            
-            logger.debug(f"Response from GET {response.url} {response.status_code}")
-            
-            # Only include episodes with file downloaded
-            downloaded_episodes = [ep for ep in episodes if ep.get("hasFile", False)]
-            
-            # Grouping episodes by most recent date of an episode found in a season
-            season_dates = defaultdict(lambda: None)
-            for ep in downloaded_episodes:
-                season = ep["seasonNumber"]
-                date_added = ep["episodeFile"]["dateAdded"]
-                
-                # If no date is recorded for the season or we find a more recent one, update
-                if season_dates[season] is None or date_added > season_dates[season]:
-                    season_dates[season] = date_added
-            
-            # Each episode in a season will receive the most recent downloaded episode date
-            for ep in downloaded_episodes:
-                ep["episodeFile"]["dateAdded"] = season_dates[ep["seasonNumber"]]
-            
-            downloaded_episodes_sorted = sorted(
-                downloaded_episodes, 
-                key=lambda x: (x["episodeFile"]["dateAdded"], x["seasonNumber"], x["episodeNumber"])
-            )
-            
-            logger.debug(f"Got episodes for seriesId {series_id} with file")
-            return downloaded_episodes_sorted
-            
-        except requests.RequestException as e:
-            logger.error(f"Error getting episodes for series {series_id}: {e}")
-            return []
-    
-    def delete_episodes(self, episodes_to_delete):
-        """
-        Delete selected episodes from Sonarr.
-        
-        Args:
-            episodes_to_delete (list): List of episodes to delete.
-        """
-        from utils.delete_manual_import import DeleteManualImportManager
-        from utils.telegram_notifier import res_actions_send
-        
-        instance = self.primary_instance
-        res_actions_del = []
-        res_actions_nodel = []
-        
-        # Check dry_run mode
-        dry_run = self.app_config.general.get('dry_run', True)
-        if dry_run:
-            logger.info("🔍 DRY RUN MODE: Episodes will not be actually deleted from Sonarr")
-        
-        # Initialize the manual import manager
-        manual_import_manager = DeleteManualImportManager(self.app_config)
-        
-        for episode in episodes_to_delete:
-            res_actions_del_add, res_actions_nodel_add = manual_import_manager.process_item('sonarr', episode['episodeId'])
-            res_actions_del.extend(res_actions_del_add)
-            res_actions_nodel.extend(res_actions_nodel_add)
-            
-            if dry_run:
-                logger.info(f"🔍 DRY RUN: Would delete episode id {episode['episodeFileId']} from Sonarr")
-            else:
-                try:
-                    response = requests.delete(
-                        f"{instance.api_url}/api/v3/episodefile/{episode['episodeFileId']}", 
-                        headers=instance.headers
-                    )
-                    logger.info(f"Deleting episode id {episode['episodeFileId']}: "
-                              f"{instance.api_url}/api/v3/episodefile/{episode['episodeFileId']}: "
-                              f"STATUS {response.status_code}")
-                except requests.RequestException as e:
-                    logger.error(f"Error deleting episode {episode['episodeFileId']}: {e}")
-        
-        logger.info(json.dumps(res_actions_del, indent=4))
-        logger.info(json.dumps(res_actions_nodel, indent=4))
-        res_actions_send(res_actions_del, res_actions_nodel)
-    
-    def get_spanish_title(self, tmdb_id, original):
-        """
-        Get the Spanish title of a series from TMDb if available.
-        
-        Args:
-            tmdb_id (int): TMDb ID of the series.
-            original (str): Original title to use as fallback.
-            
-        Returns:
-            str: Spanish title if available, otherwise original title.
-        """
-        if not tmdb_id or not self.tmdb_api_key:
-            return original
-        
-        try:
-            tmdb_url = f"https://api.themoviedb.org/3/tv/{tmdb_id}?api_key={self.tmdb_api_key}&language={self.tmdb_language}"
-            response = requests.get(tmdb_url)
-            response.raise_for_status()
-            tmdb_data = response.json()
-            
-            return tmdb_data.get("name", original)  # Return Spanish title if available
-        except requests.RequestException as e:
-            logger.warning(f"Error getting Spanish title from TMDb: {e}")
-            return original
-    
-    def process_queue(self, events):
-        """
-        Process a queue of episodes added in Sonarr and manage batch deletion.
-        
-        Args:
-            events (list): List of episode events to process.
-        """
-        logger.info(f"Processing batch of {len(events)} Sonarr episodes")
-        
-        # Filter invalid events
-        valid_events = [
-            event for event in events
-            if event.get("eventType", "").lower() != "test" and "series" in event
-        ]
-        
-        if not valid_events:
-            logger.info("All received events are test events (eventType: 'Test') or invalid")
-            return
-        
-        if not events:
-            logger.warning("Sonarr episode queue is empty. Nothing to process.")
-            return
-        
-        series_episodes_added = defaultdict(list)
-        series_episodes_deleted = defaultdict(list)
-        series_episodes_updated = defaultdict(list)
-        freed_space = 0
-        available_space = self.get_disk_space()
-        
-        if available_space > self.primary_instance.hard_drive_threshold:
-            logger.info(f"Sufficient disk space ({bytes_to_gb(available_space)} GB), "
-                       f"no episodes will be deleted.")
-            
-            for event in events:
-                series = f'{self.get_spanish_title(event["series"].get("tmdbId", ""), event["series"]["title"])} ({event["series"]["year"]})'
-                series_imdbid = event["series"].get("imdbId", "")
-                season = event["episodes"][0]["seasonNumber"]
-                episode_n = event["episodes"][0]["episodeNumber"]
-                episode_tvdbid = event["episodes"][0]["tvdbId"]
-                
-                episode_data = {
-                    "season": f"{season:02d}",
-                    "episode": f"{episode_n:02d}",
-                    "url": f"https://www.thetvdb.com/?tab=episode&id={episode_tvdbid}",
-                    "imdbUrl": f"https://www.imdb.com/{self.imdb_language}/title/{series_imdbid}",
-                }
-                
-                if event.get("isUpgrade", False):
-                    series_episodes_updated[series].append(episode_data)
-                else:
-                    series_episodes_added[series].append(episode_data)
-        
-        else:
-            logger.info(f"Insufficient disk space ({bytes_to_gb(available_space)} GB) "
-                       f"from threshold {bytes_to_gb(self.primary_instance.hard_drive_threshold)}")
-            
-            for event in events:
-                series = f'{self.get_spanish_title(event["series"].get("tmdbId", ""), event["series"]["title"])} ({event["series"]["year"]})'
-                series_imdbid = event["series"].get("imdbId", "")
-                season = event["episodes"][0]["seasonNumber"]
-                episode_n = event["episodes"][0]["episodeNumber"]
-                episode_tvdbid = event["episodes"][0]["tvdbId"]
-                
-                episode_data = {
-                    "season": f"{season:02d}",
-                    "episode": f"{episode_n:02d}",
-                    "url": f"https://www.thetvdb.com/?tab=episode&id={episode_tvdbid}",
-                    "imdbUrl": f"https://www.imdb.com/{self.imdb_language}/title/{series_imdbid}",
-                }
-                
-                if event.get("isUpgrade", False):
-                    series_episodes_updated[series].append(episode_data)
-                else:
-                    series_episodes_added[series].append(episode_data)
-            
-            # Calculate total space needed for all episodes in the queue
-            total_size_to_add = sum(event["episodeFile"]["size"] for event in events)
-            logger.info(f"Space required for new episodes: {bytes_to_gb(total_size_to_add)} GB")
-            
-            tag_no_delete_id = self.get_no_delete_tag_id()
-            available_series = self.get_series_without_no_delete_tag(tag_no_delete_id)
-            
-            total_episodes = []
-            series_dict = {
-                series["id"]: {
-                    "title": self.get_spanish_title(series["tmdbId"], series["title"]),
-                    "year": series["year"],
-                    "tmdbId": series.get("tmdbId", ""),
-                    "imdbId": series.get("imdbId", "")
-                }
-                for series in available_series
-            }
-            logger.debug(f"Series ID - Title dictionary created: {json.dumps(series_dict, indent=4)}")
-            
-            for series_data in available_series:
-                total_episodes.extend(self.get_downloaded_episodes(series_data["id"]))
-            
-            # Sort episodes by most recent season date, then by season and episode number
-            total_episodes = sorted(
-                total_episodes, 
-                key=lambda x: (x["episodeFile"]["dateAdded"], x["seasonNumber"], x["episodeNumber"])
-            )
-            
-            logger.info(f"Total episodes eligible for deletion: {len(total_episodes)}")
-            
-            # Structures for deleting episodes and logging notifications
-            episodes_to_delete = []
-            
-            # Select episodes to delete until enough space is freed
-            for episode in total_episodes:
-                if freed_space >= total_size_to_add:
-                    break
-                
-                episode_file_id = episode["episodeFileId"]
-                series_title = f"{series_dict[episode['seriesId']]['title']} ({series_dict[episode['seriesId']]['year']})"
-                season = episode["seasonNumber"]
-                episode_num = episode["episodeNumber"]
-                episode_file_size = episode["episodeFile"]["size"]  # In bytes
-                episode_tvdbid = episode.get("tvdbId", "")
-                
-                freed_space += episode_file_size
-                episodes_to_delete.append({
-                    "episodeFileId": episode_file_id,
-                    "seriesId": episode['seriesId'],
-                    "episodeId": episode['id']
-                })
-                
-                series_episodes_deleted[series_title].append({
-                    "season": f"{season:02d}",
-                    "episode": f"{episode_num:02d}",
-                    "url": f"https://www.thetvdb.com/?tab=episode&id={episode_tvdbid}",
-                    "imdbUrl": f"https://www.imdb.com/{self.imdb_language}/title/{series_dict[episode['seriesId']]['imdbId']}",
-                })
-                
-                logger.debug(f"Marking for deletion: {series_title} S{season:02d}E{episode_num:02d} "
-                           f"({bytes_to_gb(episode_file_size)} GB)")
-            
-            # Execute episode deletion
-            self.delete_episodes(episodes_to_delete)
-        
-        # Final notification with added and deleted episodes
-        logger.info(f"Sonarr message dict added episodes: {json.dumps(series_episodes_added, indent=4)}")
-        logger.info(f"Sonarr message dict updated episodes: {json.dumps(series_episodes_updated, indent=4)}")
-        logger.info(f"Sonarr message dict deleted episodes: {json.dumps(series_episodes_deleted, indent=4)}")
-        logger.info(f"Total space freed: {bytes_to_gb(freed_space)} GB")
-        
-        # Send notification to Telegram
-        from utils.telegram_notifier import TelegramNotifier
-        telegram_notifier = TelegramNotifier(self.app_config)
-        telegram_notifier.send_sonarr_message(
-            series_episodes_added, 
-            series_episodes_deleted, 
-            series_episodes_updated, 
-            freed_space
-        )
+import heapq
+import itertools
+import logging
+import time
+import requests
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter, Retry
+from app.logger import logger
+from utils.delete_manual_import import DeleteManualImportManager
+from utils.json_fast import json_loads, json_dumps
+from utils.telegram_notifier import TelegramNotifier, res_actions_send
+from utils.tmdb_cache import title_cache
+from utils.utils import bytes_to_gb, exit_with_error
+
+# Free space barely moves between near-simultaneous webhooks; keep it briefly
+_DISK_SPACE_TTL = 5
+
+# TheTVDB episode link prefix is constant
+_TVDB_URL_PREFIX = "https://www.thetvdb.com/?tab=episode&id="
+
+# Season/episode numbers are near-always < 100; index a precomputed table
+# instead of re-running format machinery per event
+_PAD2 = [f"{i:02d}" for i in range(100)]
+
+
+def _pad2(number):
+    """Zero-pad a season/episode number to two digits."""
+    return _PAD2[number] if 0 <= number < 100 else f"{number:02d}"
+
+class SonarrLogic:
+    """
+    Class for handling Sonarr business logic.
+    
+    This class manages all interactions with Sonarr instances, including
+    webhooks processing, series management, disk space monitoring,
+    and automated quality upgrades.
+    """
+    
+    def __init__(self, app_config):
+        """
+        Initialize SonarrLogic with application configuration.
+        
+        Args:
+            app_config: Application configuration containing Sonarr instances
+                       and other service configurations.
+        """
+        self.app_config = app_config
+        self.sonarr_instances = app_config.sonarr_instances
+        self.tmdb_api_key = app_config.tmdb.api_key
+        self.tmdb_language = app_config.tmdb.language
+        self.imdb_language = app_config.imdb.language
+        # IMDb link prefix is constant for the process lifetime
+        self._imdb_url_prefix = f"https://www.imdb.com/{self.imdb_language}/title/"
+
+        # Shared session: keep-alive connections to Sonarr and TMDb with
+        # retries. Pool size stays above the thread-pool fan-out so each
+        # worker gets a persistent connection instead of handshaking.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4, pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=(429, 500, 502, 503, 504))
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # Tags essentially never change during a process lifetime; cache the
+        # resolved 'no_delete' tag id per instance name
+        self._no_delete_tag_ids = {}
+
+        # Very short-TTL cache of free space per hard drive route,
+        # as (free_bytes, fetched_at)
+        self._disk_space_cache = {}
+
+        # One manager for the process lifetime so its setup and HTTP
+        # connections are shared across deletion batches
+        self._manual_import_manager = DeleteManualImportManager(app_config)
+
+        # Single notifier instance reused for every webhook, so duplicate
+        # suppression and per-chat pacing survive across events
+        self.telegram_notifier = TelegramNotifier(app_config)
+
+        # Use the first instance as default (can be expanded for multiple instances)
+        if self.sonarr_instances:
+            self.primary_instance = self.sonarr_instances[0]
+        else:
+            logger.error("No Sonarr instances configured")
+            exit_with_error("No Sonarr instances configured")
+    
+    def get_disk_space(self, instance=None):
+        """
+        Get free disk space where Sonarr files are stored.
+        
+        Args:
+            instance: Sonarr instance to check. Uses primary instance if None.
+            
+        Returns:
+            int: Free space in bytes.
+            
+        Raises:
+            SystemExit: If the configured hard drive route is not found.
+        """
+        if instance is None:
+            instance = self.primary_instance
+
+        cached = self._disk_space_cache.get(instance.hard_drive_route)
+        if cached is not None and time.monotonic() - cached[1] < _DISK_SPACE_TTL:
+            logger.debug(f"Using cached disk space for {instance.hard_drive_route}")
+            return cached[0]
+
+        diskspace_url = f"{instance.api_url}/api/v3/diskspace"
+        logger.debug(f"Obtaining disk space from GET {diskspace_url}")
+        
+        try:
+            response = self.session.get(diskspace_url, headers=instance.headers, timeout=(3, 10))
+            response.raise_for_status()
+            disk_data = json_loads(response.content)
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Response from GET {json_dumps(disk_data, indent=4)}")
+            
+            for disk in disk_data:
+                if instance.hard_drive_route == disk['path']:
+                    logger.debug(f'{instance.hard_drive_route} has {bytes_to_gb(disk["freeSpace"])} GB'
+                               f' out of {bytes_to_gb(disk["totalSpace"])} GB')
+                    self._disk_space_cache[instance.hard_drive_route] = (
+                        disk['freeSpace'], time.monotonic()
+                    )
+                    return disk['freeSpace']
+            
+            exit_with_error(f'{instance.hard_drive_route} route not found')
+            
+        except requests.RequestException as e:
+            logger.error(f"Error getting disk space from Sonarr: {e}")
+            exit_with_error(f"Failed to get disk space from Sonarr: {e}")
+    
+    def get_no_delete_tag_id(self, instance=None):
+        """
+        Get the ID of the 'no_delete' tag in Sonarr.
+        
+        Args:
+            instance: Sonarr instance to check. Uses primary instance if None.
+            
+        Returns:
+            int: ID of the 'no_delete' tag.
+            
+        Raises:
+            SystemExit: If the 'no_delete' tag is not found.
+        """
+        if instance is None:
+            instance = self.primary_instance
+
+        cached_id = self._no_delete_tag_ids.get(instance.name)
+        if cached_id is not None:
+            return cached_id
+
+        tag_url = f"{instance.api_url}/api/v3/tag"
+        logger.debug(f"Obtaining ID tag from GET {tag_url}")
+        
+        try:
+            response = self.session.get(tag_url, headers=instance.headers, timeout=(3, 10))
+            response.raise_for_status()
+            tags = json_loads(response.content)
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Response from GET {json_dumps(tags, indent=4)}")
+            
+            for tag in tags:
+                if tag["label"].lower() == "no_delete":
+                    logger.debug(f"no_delete tag id: {tag['id']}")
+                    self._no_delete_tag_ids[instance.name] = tag["id"]
+                    return tag["id"]
+            
+            exit_with_error(f'{tag_url} no_delete tag not found')
+            
+        except requests.RequestException as e:
+            logger.error(f"Error getting tags from Sonarr: {e}")
+            exit_with_error(f"Failed to get tags from Sonarr: {e}")
+    
+    def get_series_without_no_delete_tag(self, tag_id, instance=None):
+        """
+        Get all Sonarr series without the 'no_delete' tag.
+        
+        Args:
+            tag_id (int): ID of the 'no_delete' tag to filter out.
+            instance: Sonarr instance to check. Uses primary instance if None.
+            
+        Returns:
+            list: List of series that don't have the 'no_delete' tag.
+        """
+        if instance is None:
+            instance = self.primary_instance
+            
+        series_url = f"{instance.api_url}/api/v3/series?includeSeasonImages=False"
+        logger.debug(f"Calling GET {series_url}")
+        
+        try:
+            response = self.session.get(series_url, headers=instance.headers, timeout=(3, 10))
+            response.raise_for_status()
+            series = json_loads(response.content)
+            
+            logger.debug(f"Response from GET {response.status_code} {len(series)} series")
+            
+            filtered_series = [serie for serie in series if tag_id not in serie["tags"]]
+            logger.debug(f"Filtered series {len(filtered_series)} series without 'no_delete' tag")
+            
+            return filtered_series
+            
+        except requests.RequestException as e:
+            logger.error(f"Error getting series from Sonarr: {e}")
+            exit_with_error(f"Failed to get series from Sonarr: {e}")
+    
+    def get_downloaded_episodes(self, series_id, instance=None):
+        """
+        Get downloaded episodes of a series and sort them by age.
+        
+        Args:
+            series_id (int): ID of the series in Sonarr.
+            instance: Sonarr instance to check. Uses primary instance if None.
+            
+        Returns:
+            list: List of downloaded episodes sorted by date, season, and episode number.
+        """
+        if instance is None:
+            instance = self.primary_instance
+            
+        # Two lean listings instead of one with embedded file objects: the
+        # episodefile endpoint carries exactly the file fields we need, and
+        # the plain episode listing (no includeEpisodeFile) skips the bulky
+        # per-episode quality/mediaInfo blocks
+        files_url = f"{instance.api_url}/api/v3/episodefile?seriesId={series_id}"
+        episode_url = f"{instance.api_url}/api/v3/episode?seriesId={series_id}&includeEpisodeFile=false&includeSeries=false"
+        logger.debug(f"Calling GET {files_url} and GET {episode_url}")
+        
+        try:
+            response = self.session.get(files_url, headers=instance.headers, timeout=(3, 10))
+            response.raise_for_status()
+            files_by_id = {
+                episode_file["id"]: episode_file for episode_file in json_loads(response.content)
+            }
+
+            response = self.session.get(episode_url, headers=instance.headers, timeout=(3, 10))
+            response.raise_for_status()
+            episodes = json_loads(response.content)
+            
+            logger.debug(f"Response from GET {response.url} {response.status_code}")
+            
+            # Grouping episodes by most recent date of an episode found in a season
+            season_dates = {}
+            for ep in episodes:
+                episode_file = files_by_id.get(ep.get("episodeFileId"))
+                if episode_file is None:
+                    continue
+                season = ep["seasonNumber"]
+                date_added = episode_file.get("dateAdded", "")
+
+                # If no date is recorded for the season or we find a more recent one, update
+                previous = season_dates.get(season)
+                if previous is None or date_added > previous:
+                    season_dates[season] = date_added
+
+            # Only include episodes with file downloaded, projected down to
+            # the fields the deletion pipeline reads. The projected dateAdded
+            # is already the most recent date of the episode's season, so no
+            # separate write-back pass over the list is needed.
+            downloaded_episodes = [
+                {
+                    "id": ep["id"],
+                    "seriesId": ep.get("seriesId"),
+                    "episodeFileId": ep.get("episodeFileId"),
+                    "seasonNumber": ep["seasonNumber"],
+                    "episodeNumber": ep["episodeNumber"],
+                    "tvdbId": ep.get("tvdbId", ""),
+                    "episodeFile": {
+                        "dateAdded": season_dates[ep["seasonNumber"]],
+                        "size": files_by_id[ep["episodeFileId"]].get("size", 0),
+                    },
+                }
+                for ep in episodes if ep.get("episodeFileId") in files_by_id
+            ]
+            
+            # This per-series ordering is load-bearing: process_queue merges
+            # the lists lazily with heapq.merge instead of re-sorting, so each
+            # input must already be sorted by the same key
+            downloaded_episodes_sorted = sorted(
+                downloaded_episodes, 
+                key=lambda x: (x["episodeFile"]["dateAdded"], x["seasonNumber"], x["episodeNumber"])
+            )
+            
+            logger.debug(f"Got episodes for seriesId {series_id} with file")
+            return downloaded_episodes_sorted
+            
+        except requests.RequestException as e:
+            logger.error(f"Error getting episodes for series {series_id}: {e}")
+            return []
+    
+    def delete_episodes(self, episodes_to_delete):
+        """
+        Delete selected episodes from Sonarr.
+        
+        Args:
+            episodes_to_delete (list): List of episodes to delete.
+        """
+        instance = self.primary_instance
+        res_actions_del = []
+        res_actions_nodel = []
+        
+        # Check dry_run mode (validated once at startup)
+        dry_run = self.app_config.dry_run
+        if dry_run:
+            logger.info("🔍 DRY RUN MODE: Episodes will not be actually deleted from Sonarr")
+        
+        manual_import_manager = self._manual_import_manager
+
+        # Torrent cleanups are independent per episode and I/O-bound, run
+        # them concurrently, then flatten each side of the (deleted, kept)
+        # pairs once
+        if episodes_to_delete:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = executor.map(
+                    lambda episode: manual_import_manager.process_item('sonarr', episode['episodeId']),
+                    episodes_to_delete
+                )
+                dels, nodels = zip(*results)
+            res_actions_del = list(itertools.chain.from_iterable(dels))
+            res_actions_nodel = list(itertools.chain.from_iterable(nodels))
+
+        episode_file_ids = [episode['episodeFileId'] for episode in episodes_to_delete]
+        if dry_run:
+            for episode_file_id in episode_file_ids:
+                logger.info(f"🔍 DRY RUN: Would delete episode id {episode_file_id} from Sonarr")
+        elif episode_file_ids:
+            # One bulk call instead of a DELETE round-trip per episode file;
+            # older Sonarr versions without the bulk endpoint fall back to
+            # per-file deletes
+            try:
+                response = self.session.delete(
+                    f"{instance.api_url}/api/v3/episodefile/bulk",
+                    headers=instance.headers,
+                    json={"episodeFileIds": episode_file_ids},
+                    timeout=(3, 30)
+                )
+                if response.status_code in (404, 405):
+                    self._delete_episode_files_individually(instance, episode_file_ids)
+                else:
+                    logger.info(f"Bulk deleting {len(episode_file_ids)} episode files "
+                              f"{episode_file_ids}: {instance.api_url}/api/v3/episodefile/bulk: "
+                              f"STATUS {response.status_code}")
+            except requests.RequestException as e:
+                logger.error(f"Error bulk deleting episode files {episode_file_ids}: {e}")
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(json_dumps(res_actions_del, indent=4))
+            logger.info(json_dumps(res_actions_nodel, indent=4))
+        res_actions_send(res_actions_del, res_actions_nodel)
+    
+    def _delete_episode_files_individually(self, instance, episode_file_ids):
+        """
+        Delete episode files one by one.
+
+        Fallback for Sonarr versions that predate the bulk endpoint.
+
+        Args:
+            instance: Sonarr instance to delete from.
+            episode_file_ids (list): Episode file IDs to delete.
+        """
+        for episode_file_id in episode_file_ids:
+            try:
+                response = self.session.delete(
+                    f"{instance.api_url}/api/v3/episodefile/{episode_file_id}",
+                    headers=instance.headers,
+                    timeout=(3, 30)
+                )
+                logger.info(f"Deleting episode id {episode_file_id}: "
+                          f"{instance.api_url}/api/v3/episodefile/{episode_file_id}: "
+                          f"STATUS {response.status_code}")
+            except requests.RequestException as e:
+                logger.error(f"Error deleting episode {episode_file_id}: {e}")
+
+    def get_spanish_title(self, tmdb_id, original):
+        """
+        Get the Spanish title of a series from TMDb if available.
+        
+        Args:
+            tmdb_id (int): TMDb ID of the series.
+            original (str): Original title to use as fallback.
+            
+        Returns:
+            str: Spanish title if available, otherwise original title.
+        """
+        if not tmdb_id or not self.tmdb_api_key:
+            return original
+
+        cached = title_cache.get('tv', tmdb_id, self.tmdb_language)
+        if cached is not None:
+            return cached
+
+        try:
+            tmdb_url = f"https://api.themoviedb.org/3/tv/{tmdb_id}?api_key={self.tmdb_api_key}&language={self.tmdb_language}"
+            response = self.session.get(tmdb_url, timeout=(3, 10))
+            response.raise_for_status()
+            tmdb_data = json_loads(response.content)
+
+            if "name" in tmdb_data:
+                title_cache.set('tv', tmdb_id, self.tmdb_language, tmdb_data["name"])
+            return tmdb_data.get("name", original)  # Return Spanish title if available
+        except requests.RequestException as e:
+            logger.warning(f"Error getting Spanish title from TMDb: {e}")
+            return original
+    
+    def prefetch_titles(self, id_title_pairs):
+        """
+        Fetch localized titles for several series concurrently.
+
+        Warms the shared title cache so subsequent get_spanish_title calls
+        in the batch are dict hits instead of TMDb round-trips.
+
+        Args:
+            id_title_pairs (list): (tmdb_id, original_title) tuples.
+        """
+        unique = {}
+        for tmdb_id, original in id_title_pairs:
+            unique.setdefault(tmdb_id, original)
+
+        if not unique:
+            return
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            # Consume the iterator so the fetches actually run
+            list(executor.map(
+                lambda item: self.get_spanish_title(item[0], item[1]),
+                unique.items()
+            ))
+
+    def process_queue(self, events):
+        """
+        Process a queue of episodes added in Sonarr and manage batch deletion.
+        
+        Args:
+            events (list): List of episode events to process.
+        """
+        logger.info(f"Processing batch of {len(events)} Sonarr episodes")
+
+        if not events:
+            logger.warning("Sonarr episode queue is empty. Nothing to process.")
+            return
+
+        # Filter invalid events before touching the network: all-test batches
+        # (Sonarr health checks) return here without a disk-space round-trip
+        valid_events = [
+            event for event in events
+            if event.get("eventType", "").lower() != "test" and "series" in event
+        ]
+        
+        if not valid_events:
+            logger.info("All received events are test events (eventType: 'Test') or invalid")
+            return
+        
+        series_episodes_added = defaultdict(list)
+        series_episodes_deleted = defaultdict(list)
+        series_episodes_updated = defaultdict(list)
+        freed_space = 0
+        available_space = self.get_disk_space()
+
+        # One concurrent burst fills the title cache for every series in the
+        # batch, so the loops below never block on TMDb
+        self.prefetch_titles([
+            (event["series"].get("tmdbId", ""), event["series"]["title"])
+            for event in events
+        ])
+
+        # Added/updated grouping is the same whatever the disk state, so walk
+        # the events once here; the branches below only decide about deletion.
+        # Group by series and upgrade flag first, then build each bucket's
+        # episode entries in one comprehension and extend once per group.
+        grouped_events = {}
+        for event in events:
+            series = f'{self.get_spanish_title(event["series"].get("tmdbId", ""), event["series"]["title"])} ({event["series"]["year"]})'
+            grouped_events.setdefault(
+                (series, event.get("isUpgrade", False)), []
+            ).append(event)
+
+        for (series, is_upgrade), group in grouped_events.items():
+            target = series_episodes_updated if is_upgrade else series_episodes_added
+            target[series].extend(
+                {
+                    "season": _pad2(event["episodes"][0]["seasonNumber"]),
+                    "episode": _pad2(event["episodes"][0]["episodeNumber"]),
+                    "url": _TVDB_URL_PREFIX + str(event["episodes"][0]["tvdbId"]),
+                    "imdbUrl": self._imdb_url_prefix + event["series"].get("imdbId", ""),
+                }
+                for event in group
+            )
+
+        if available_space > self.primary_instance.hard_drive_threshold:
+            logger.info(f"Sufficient disk space ({bytes_to_gb(available_space)} GB), "
+                       f"no episodes will be deleted.")
+        else:
+            logger.info(f"Insufficient disk space ({bytes_to_gb(available_space)} GB) "
+                       f"from threshold {bytes_to_gb(self.primary_instance.hard_drive_threshold)}")
+            
+            # Calculate total space needed for all episodes in the queue
+            total_size_to_add = sum(event["episodeFile"]["size"] for event in events)
+            logger.info(f"Space required for new episodes: {bytes_to_gb(total_size_to_add)} GB")
+            
+            tag_no_delete_id = self.get_no_delete_tag_id()
+            available_series = self.get_series_without_no_delete_tag(tag_no_delete_id)
+            
+            # Warm the cache for the whole library before the dict build so
+            # the comprehension below does no I/O
+            self.prefetch_titles([
+                (series.get("tmdbId", ""), series["title"])
+                for series in available_series
+            ])
+
+            # Pure dict construction: the prefetch above has already warmed
+            # the title cache, so these lookups do no I/O
+            series_dict = {
+                series["id"]: {
+                    "title": self.get_spanish_title(series.get("tmdbId", ""), series["title"]),
+                    "year": series["year"],
+                    "tmdbId": series.get("tmdbId", ""),
+                    "imdbId": series.get("imdbId", "")
+                }
+                for series in available_series
+            }
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Series ID - Title dictionary created: {json_dumps(series_dict, indent=4)}")
+            
+            # Episode listings are independent per series and network-bound;
+            # fan them out over the pooled session instead of serializing
+            # hundreds of round-trips
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                episode_lists = list(executor.map(
+                    lambda series_data: self.get_downloaded_episodes(series_data["id"]),
+                    available_series
+                ))
+
+            # Each per-series list is already sorted, so merge them lazily by
+            # most recent season date, then season and episode number; only
+            # the consumed prefix is ever compared, instead of re-sorting the
+            # full concatenated list
+            total_episodes = heapq.merge(
+                *episode_lists,
+                key=lambda x: (x["episodeFile"]["dateAdded"], x["seasonNumber"], x["episodeNumber"])
+            )
+            
+            logger.info(f"Total episodes eligible for deletion: "
+                       f"{sum(len(episode_list) for episode_list in episode_lists)}")
+            
+            # Structures for deleting episodes and logging notifications
+            episodes_to_delete = []
+            
+            # Select episodes to delete until enough space is freed
+            for episode in total_episodes:
+                if freed_space >= total_size_to_add:
+                    break
+                
+                episode_file_id = episode["episodeFileId"]
+                series_title = f"{series_dict[episode['seriesId']]['title']} ({series_dict[episode['seriesId']]['year']})"
+                season = episode["seasonNumber"]
+                episode_num = episode["episodeNumber"]
+                episode_file_size = episode["episodeFile"]["size"]  # In bytes
+                episode_tvdbid = episode.get("tvdbId", "")
+                
+                freed_space += episode_file_size
+                episodes_to_delete.append({
+                    "episodeFileId": episode_file_id,
+                    "seriesId": episode['seriesId'],
+                    "episodeId": episode['id']
+                })
+                
+                series_episodes_deleted[series_title].append({
+                    "season": _pad2(season),
+                    "episode": _pad2(episode_num),
+                    "url": _TVDB_URL_PREFIX + str(episode_tvdbid),
+                    "imdbUrl": self._imdb_url_prefix + series_dict[episode['seriesId']]['imdbId'],
+                })
+                
+                logger.debug(f"Marking for deletion: {series_title} S{season:02d}E{episode_num:02d} "
+                           f"({bytes_to_gb(episode_file_size)} GB)")
+            
+            # Execute episode deletion
+            self.delete_episodes(episodes_to_delete)
+        
+        # Final notification with added and deleted episodes
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Sonarr message dict added episodes: {json_dumps(series_episodes_added, indent=4)}")
+            logger.info(f"Sonarr message dict updated episodes: {json_dumps(series_episodes_updated, indent=4)}")
+            logger.info(f"Sonarr message dict deleted episodes: {json_dumps(series_episodes_deleted, indent=4)}")
+        logger.info(f"Total space freed: {bytes_to_gb(freed_space)} GB")
+        
+        # Send notification to Telegram
+        self.telegram_notifier.send_sonarr_message(
+            series_episodes_added, 
+            series_episodes_deleted, 
+            series_episodes_updated, 
+            freed_space
+        )
@@ -1,551 +1,809 @@
-"""
-Module for managing automatic deletion of manually imported torrents.
-
-This module handles:
-1. Finding torrents that have been manually imported in Radarr/Sonarr
-2. Verifying they have exceeded the minimum seeding threshold
-3. Deleting torrents and associated files from qBittorrent
-4. Sending process notifications via Telegram
-
-Works with both history torrents (grabbed) and manual imports
-identified by sourceTitle in manual_import categories.
-"""
-
-import json
-import os
-import re
-from datetime import timedelta
-from typing import List, Dict, Tuple, Optional
-
-import requests
-from app.logger import logger
-
-
-class DeleteManualImportManager:
-    """Manager for automatic deletion of manually imported torrents"""
-    
-    # Constants for action types and reasons
-    KEY_ACT_DEL = "DEL"
-    KEY_TYPE_HIST = "HIST"
-    KEY_TYPE_MATCH = "MATCH"
-    KEY_ACT_NODELETE = "NODELETE"
-    KEY_REASON_SEEDTIME_UNCOMPLETE = "SEEDTIME_UNCOMPLETE"
-    KEY_REASON_NO_MATCH = "NO_MATCH"
-    KEY_REASON_NOT_FOUND = "NOT_FOUND"
-    KEY_REASON_DRY_RUN = "DRY_RUN"
-    
-    # Seeding threshold in days
-    SEED_THRESHOLD_DAYS = 30
-    
-    # Regex for video extensions
-    VIDEO_EXT = re.compile(r'\.(mkv|mp4|avi|mov|wmv|m4a|flac)$', re.IGNORECASE)
-    
-    # Torrent categories to analyze
-    MOVIE_CATEGORIES = [
-        "manual_import_movies", "movies", "manual_import_prowlarr", 
-        "movies.cross-seed", "manual_import_movies.cross-seed"
-    ]
-    
-    TV_CATEGORIES = [
-        "manual_import_tv", "tv", "manual_import_prowlarr", 
-        "tv.cross-seed", "manual_import_tv.cross-seed"
-    ]
-    
-    def __init__(self, app_config):
-        """
-        Initialize the manager with application configuration
-        
-        Args:
-            app_config: Application configuration (ApplicationConfig)
-        """
-        self.app_config = app_config
-        self.dry_run = app_config.general.get('dry_run', True)
-        
-        # Radarr configuration
-        if app_config.radarr_instances:
-            self.radarr_instance = app_config.radarr_instances[0]
-            self.radarr_headers = {'X-Api-Key': self.radarr_instance.api_key}
-        else:
-            logger.error("No Radarr instances configured")
-            self.radarr_instance = None
-            self.radarr_headers = None
-        
-        # Sonarr configuration
-        if app_config.sonarr_instances:
-            self.sonarr_instance = app_config.sonarr_instances[0]
-            self.sonarr_headers = {'X-Api-Key': self.sonarr_instance.api_key}
-        else:
-            logger.error("No Sonarr instances configured")
-            self.sonarr_instance = None
-            self.sonarr_headers = None
-        
-        # qBittorrent configuration
-        from utils.qbittorrent_connections import qbit_manager
-        self.qbittorrent_manager = qbit_manager
-        
-        if self.dry_run:
-            logger.info("🔍 DRY RUN MODE ACTIVATED - Torrents will not be actually deleted")
-    
-    @staticmethod
-    def normalize(name: str) -> str:
-        """
-        Normalize a file/torrent name for comparison
-        
-        Args:
-            name: Original file/torrent name
-            
-        Returns:
-            Normalized name (no extension, spaces instead of dots/dashes, lowercase)
-        """
-        name = os.path.basename(name)
-        base = DeleteManualImportManager.VIDEO_EXT.sub('', name)
-        base = base.replace('.', ' ').replace('_', ' ')
-        return base.casefold().strip()
-    
-    @staticmethod
-    def create_action_dict(name: str, hash_value: str, action: str, type_value: str, reason: str = '') -> Dict:
-        """
-        Create a dictionary with information about an action performed
-        
-        Args:
-            name: Torrent name
-            hash_value: Torrent hash
-            action: Action performed (DEL/NODELETE)
-            type_value: Action type (HIST/MATCH)
-            reason: Reason for the action
-            
-        Returns:
-            Dictionary with action information
-        """
-        return {
-            "action": action,
-            "type": type_value,
-            "name": name,
-            "hash": hash_value,
-            "reason": reason
-        }
-    
-    def list_torrents_by_category(self, qbit_instance, category: str) -> List[Dict]:
-        """
-        Get the list of torrents in a specific category
-        
-        Args:
-            qbit_instance: qBittorrent instance
-            category: Category to filter
-            
-        Returns:
-            List of torrents in the category
-        """
-        # Login is handled by caller
-        url = f"{qbit_instance.api_url}/api/v2/torrents/info?filter=all&category={category}"
-        response = qbit_instance.session.get(url)
-        response.raise_for_status()
-        return response.json()
-    
-    def list_files_for_torrent(self, qbit_instance, torrent_hash: str) -> List[Dict]:
-        """
-        Get the list of files in a specific torrent
-        
-        Args:
-            qbit_instance: qBittorrent instance
-            torrent_hash: Torrent hash
-            
-        Returns:
-            List of files in the torrent
-        """
-        url = f"{qbit_instance.api_url}/api/v2/torrents/files?hash={torrent_hash}"
-        response = qbit_instance.session.get(url)
-        response.raise_for_status()
-        return response.json()
-    
-    def get_radarr_history_hashes(self, movie_id: int) -> List[str]:
-        """
-        Get torrent hashes 'grabbed' from Radarr history
-        
-        Args:
-            movie_id: Movie ID
-            
-        Returns:
-            List of downloaded torrent hashes
-        """
-        if not self.radarr_instance:
-            return []
-            
-        url = f"{self.radarr_instance.api_url}/api/v3/history/movie"
-        params = {'movieId': movie_id, 'eventType': 'grabbed'}
-        
-        try:
-            response = requests.get(url, headers=self.radarr_headers, params=params)
-            response.raise_for_status()
-            history_data = response.json()
-            
-            if len(history_data) > 20:
-                logger.error(f"Too many records in Radarr history ({len(history_data)}), aborting")
-                return []
-            
-            return [entry.get('downloadId') for entry in history_data if entry.get('downloadId')]
-            
-        except requests.RequestException as e:
-            logger.error(f"Error getting Radarr history: {e}")
-            return []
-    
-    def get_radarr_import_sources(self, movie_id: int) -> List[str]:
-        """
-        Get sourceTitles from Radarr manual imports
-        
-        Args:
-            movie_id: Movie ID
-            
-        Returns:
-            List of normalized titles of imported files
-        """
-        if not self.radarr_instance:
-            return []
-            
-        url = f"{self.radarr_instance.api_url}/api/v3/history/movie"
-        params = {'movieId': movie_id, 'eventType': 'downloadFolderImported'}
-        
-        try:
-            response = requests.get(url, headers=self.radarr_headers, params=params)
-            response.raise_for_status()
-            history_data = response.json()
-            
-            if len(history_data) > 20:
-                logger.error(f"Too many records in Radarr import ({len(history_data)}), aborting")
-                return []
-            
-            return [self.normalize(entry.get('sourceTitle')) for entry in history_data if entry.get('sourceTitle')]
-            
-        except requests.RequestException as e:
-            logger.error(f"Error getting Radarr imports: {e}")
-            return []
-    
-    def get_sonarr_history_hashes(self, episode_id: int) -> List[str]:
-        """
-        Get torrent hashes 'grabbed' from Sonarr history
-        
-        Args:
-            episode_id: Episode ID
-            
-        Returns:
-            List of downloaded torrent hashes
-        """
-        if not self.sonarr_instance:
-            return []
-            
-        url = f"{self.sonarr_instance.api_url}/api/v3/history?episodeId={episode_id}"
-        
-        try:
-            response = requests.get(url, headers=self.sonarr_headers)
-            response.raise_for_status()
-            data = response.json()
-            
-            records = data.get('records', [])
-            if int(data.get('totalRecords', 11)) > 10:
-                logger.error(f"Too many records in Sonarr history ({len(records)}), aborting")
-                return []
-            
-            return [entry['downloadId'] for entry in records if entry.get('downloadId')]
-            
-        except requests.RequestException as e:
-            logger.error(f"Error getting Sonarr history: {e}")
-            return []
-    
-    def get_sonarr_import_sources(self, episode_id: int) -> List[str]:
-        """
-        Get sourceTitles from Sonarr manual imports
-        
-        Args:
-            episode_id: Episode ID
-            
-        Returns:
-            List of normalized titles of imported files
-        """
-        if not self.sonarr_instance:
-            return []
-            
-        url = f"{self.sonarr_instance.api_url}/api/v3/history?episodeId={episode_id}"
-        
-        try:
-            response = requests.get(url, headers=self.sonarr_headers)
-            response.raise_for_status()
-            data = response.json()
-            
-            records = data.get('records', [])
-            if int(data.get('totalRecords', 11)) > 10:
-                logger.error(f"Too many records in Sonarr import ({len(records)}), aborting")
-                return []
-            
-            return [self.normalize(entry['sourceTitle']) for entry in records if entry.get('sourceTitle')]
-            
-        except requests.RequestException as e:
-            logger.error(f"Error getting Sonarr imports: {e}")
-            return []
-    
-    def delete_torrent_from_qbittorrent(self, qbit_instance, torrent_hash: str, torrent_name: str) -> bool:
-        """
-        Delete a torrent from qBittorrent
-        
-        Args:
-            qbit_instance: qBittorrent instance
-            torrent_hash: Hash of the torrent to delete
-            torrent_name: Torrent name (for logs)
-            
-        Returns:
-            True if deleted successfully, False otherwise
-        """
-        if self.dry_run:
-            logger.info(f"🔍 DRY RUN: Would delete torrent {torrent_name} ({torrent_hash}) from {qbit_instance.name}")
-            return True
-        
-        try:
-            response = qbit_instance.session.post(
-                f"{qbit_instance.api_url}/api/v2/torrents/delete",
-                data={"hashes": torrent_hash, "deleteFiles": True}
-            )
-            
-            if response.ok:
-                logger.info(f"✅ Torrent deleted: {torrent_name} ({torrent_hash}) from {qbit_instance.name}")
-                return True
-            else:
-                logger.error(f"❌ Error deleting torrent {torrent_hash}: {response.status_code} {response.text}")
-                return False
-                
-        except requests.RequestException as e:
-            logger.error(f"❌ Connection error deleting torrent {torrent_hash}: {e}")
-            return False
-    
-    def process_history_torrents(self, media: str, item_id: int, hashes: List[str], sources: List[str]) -> Tuple[List[Dict], List[Dict]]:
-        """
-        Process history torrents (grabbed) for deletion
-        
-        Args:
-            media: Media type ('radarr' or 'sonarr')
-            item_id: Item ID (movie_id or episode_id)
-            hashes: List of hashes from history
-            sources: List of sources for logging
-            
-        Returns:
-            Tuple with (deleted_actions, non_deleted_actions)
-        """
-        res_actions_del = []
-        res_actions_nodel = []
-        
-        if not hashes:
-            return res_actions_del, res_actions_nodel
-        
-        logger.info(f"🔍 Processing {len(hashes)} history torrents for {media} {item_id}")
-        
-        # Remove duplicates
-        unique_hashes = set(hashes)
-        
-        for qbit_instance in self.qbittorrent_manager.get_all_instances():
-            # Login only once per instance
-            qbit_instance.login()
-            
-            # Get seeding information for all hashes
-            torrents_info = qbit_instance.get_torrent_info(list(unique_hashes)) or []
-            
-            # Create a hash lookup dictionary
-            torrent_dict = {torrent['hash'].lower(): torrent for torrent in torrents_info}
-            
-            for hash_value in unique_hashes:
-                hash_lower = hash_value.lower()
-                torrent_data = torrent_dict.get(hash_lower)
-                
-                source_name = sources[0] if sources else f"Unknown-{item_id}"
-                
-                if torrent_data:
-                    seed_days = torrent_data.get('seeding_time', 0) / 86400
-                    
-                    if seed_days >= self.SEED_THRESHOLD_DAYS:
-                        if self.delete_torrent_from_qbittorrent(qbit_instance, hash_value, source_name):
-                            reason = self.KEY_REASON_DRY_RUN if self.dry_run else ""
-                            res_actions_del.append(
-                                self.create_action_dict(source_name, hash_value, self.KEY_ACT_DEL, self.KEY_TYPE_HIST, reason)
-                            )
-                    else:
-                        logger.info(f"⏸️  Torrent {hash_value} seed={seed_days:.1f}d < {self.SEED_THRESHOLD_DAYS}d → skipped")
-                        res_actions_nodel.append(
-                            self.create_action_dict(source_name, hash_value, self.KEY_ACT_NODELETE, self.KEY_TYPE_HIST, self.KEY_REASON_SEEDTIME_UNCOMPLETE)
-                        )
-                else:
-                    # Torrent not found in this instance
-                    logger.info(f"⏸️  Torrent {hash_value} seed=0.0d < {self.SEED_THRESHOLD_DAYS}d → skipped")
-                    res_actions_nodel.append(
-                        self.create_action_dict(source_name, hash_value, self.KEY_ACT_NODELETE, self.KEY_TYPE_HIST, f"{self.KEY_REASON_NOT_FOUND} {qbit_instance.name}")
-                    )
-        
-        return res_actions_del, res_actions_nodel
-    
-    def find_manual_import_matches(self, sources: List[str], categories: List[str]) -> List[Tuple]:
-        """
-        Find ALL torrents that match manually imported files (including cross-seeds)
-        
-        Args:
-            sources: List of normalized sources
-            categories: List of categories to search
-            
-        Returns:
-            List of tuples (instance, torrent, reason) for all matches found
-        """
-        if not sources:
-            return []
-        
-        # Collect all candidate torrents
-        candidates = []
-        for qbit_instance in self.qbittorrent_manager.get_all_instances():
-            # Login once per instance
-            qbit_instance.login()
-            for category in categories:
-                try:
-                    torrents = self.list_torrents_by_category(qbit_instance, category)
-                    for torrent in torrents:
-                        candidates.append((qbit_instance, torrent))
-                except Exception as e:
-                    logger.warning(f"Error getting torrents from category {category} in {qbit_instance.name}: {e}")
-        
-        # Normalize sources for comparison
-        normalized_sources = set(sources)
-        logger.debug(f"🔍 Searching for matches for sources: {normalized_sources}")
-        
-        matches = []
-        
-        # Search for exact match by torrent name
-        for qbit_instance, torrent in candidates:
-            torrent_name_normalized = self.normalize(torrent['name'])
-            if torrent_name_normalized in normalized_sources:
-                matches.append((qbit_instance, torrent, f"name == {torrent_name_normalized!r}"))
-        
-        # Search for match in internal torrent files
-        for qbit_instance, torrent in candidates:
-            # Skip if already matched by name
-            if any(match[1]['hash'] == torrent['hash'] for match in matches):
-                continue
-                
-            try:
-                files = self.list_files_for_torrent(qbit_instance, torrent['hash'])
-                for file_info in files:
-                    file_name_normalized = self.normalize(file_info['name'])
-                    if file_name_normalized in normalized_sources:
-                        matches.append((qbit_instance, torrent, f"file == {file_name_normalized!r}"))
-                        break  # Don't add the same torrent multiple times for different files
-            except Exception as e:
-                logger.warning(f"Error getting files for torrent {torrent['hash']}: {e}")
-                continue
-        
-        logger.info(f"🎯 Found {len(matches)} matching torrents (including cross-seeds)")
-        return matches
-    
-    def process_manual_import_torrents(self, media: str, item_id: int, sources: List[str]) -> Tuple[List[Dict], List[Dict]]:
-        """
-        Process manual import torrents for deletion (including cross-seeds)
-        
-        Args:
-            media: Media type ('radarr' or 'sonarr')
-            item_id: Item ID
-            sources: List of import sources
-            
-        Returns:
-            Tuple with (deleted_actions, not_deleted_actions)
-        """
-        res_actions_del = []
-        res_actions_nodel = []
-        
-        if not sources:
-            logger.debug(f"No sources for {media} {item_id}")
-            return res_actions_del, res_actions_nodel
-        
-        # Select categories based on media type
-        categories = self.MOVIE_CATEGORIES if media == 'radarr' else self.TV_CATEGORIES
-        
-        # Search for ALL matches (including cross-seeds)
-        matches = self.find_manual_import_matches(sources, categories)
-        
-        if not matches:
-            logger.debug(f"❌ No manual torrent matches found for {media} {item_id}")
-            res_actions_nodel.append(
-                self.create_action_dict(sources[0], "", self.KEY_ACT_NODELETE, self.KEY_TYPE_MATCH, self.KEY_REASON_NO_MATCH)
-            )
-            return res_actions_del, res_actions_nodel
-        
-        # Process each matching torrent
-        for match_index, (qbit_instance, torrent, reason) in enumerate(matches, 1):
-            logger.info(f"🎯 Processing match {match_index}/{len(matches)}: {torrent['name']} ({torrent['hash']}) in {qbit_instance.name} by {reason}")
-            
-            # Check seeding time
-            try:
-                info_list = qbit_instance.get_torrent_info([torrent['hash']])
-                torrent_data = info_list[0] if info_list else {}
-                seed_sec = torrent_data.get('seeding_time', 0)
-                seed_days = seed_sec / 86400
-                
-                logger.info(f"🎯 Match {match_index}: {torrent['name']} ({torrent['hash']}) in {qbit_instance.name} by {reason}; seed={seed_days:.1f}d")
-                
-                # Check seeding threshold
-                if seed_days < self.SEED_THRESHOLD_DAYS:
-                    logger.info(f"⏸️  Seed {seed_days:.1f}d < {self.SEED_THRESHOLD_DAYS}d → skipped")
-                    res_actions_nodel.append(
-                        self.create_action_dict(torrent['name'], torrent['hash'], self.KEY_ACT_NODELETE, self.KEY_TYPE_MATCH, self.KEY_REASON_SEEDTIME_UNCOMPLETE)
-                    )
-                    continue
-                
-                # Proceed with deletion
-                if self.delete_torrent_from_qbittorrent(qbit_instance, torrent['hash'], torrent['name']):
-                    reason_suffix = self.KEY_REASON_DRY_RUN if self.dry_run else ""
-                    res_actions_del.append(
-                        self.create_action_dict(torrent['name'], torrent['hash'], self.KEY_ACT_DEL, self.KEY_TYPE_MATCH, reason_suffix)
-                    )
-                else:
-                    res_actions_nodel.append(
-                        self.create_action_dict(torrent['name'], torrent['hash'], self.KEY_ACT_NODELETE, self.KEY_TYPE_MATCH, "ERROR_DELETE")
-                    )
-                    
-            except Exception as e:
-                logger.error(f"Error processing torrent {torrent['hash']}: {e}")
-                res_actions_nodel.append(
-                    self.create_action_dict(torrent['name'], torrent['hash'], self.KEY_ACT_NODELETE, self.KEY_TYPE_MATCH, f"ERROR: {str(e)}")
-                )
-        
-        return res_actions_del, res_actions_nodel
-    
-    def process_item(self, media: str, item_id: int) -> Tuple[List[Dict], List[Dict]]:
-        """
-        Process an item (movie or episode) for torrent deletion
-        
-        Args:
-            media: Media type ('radarr' or 'sonarr')
-            item_id: Item ID (movie_id or episode_id)
-            
-        Returns:
-            Tuple with (deleted_actions, not_deleted_actions)
-        """
-        logger.info(f"🔄 Processing {media} item {item_id}")
-        
-        # Get history and sources based on media type
-        if media == 'radarr':
-            hashes = self.get_radarr_history_hashes(item_id)
-            sources = self.get_radarr_import_sources(item_id)
-            logger.debug(f"📚 Radarr - Hashes: {len(hashes)}, Sources: {sources}")
-        else:  # sonarr
-            hashes = self.get_sonarr_history_hashes(item_id)
-            sources = self.get_sonarr_import_sources(item_id)
-            logger.debug(f"📺 Sonarr - Hashes: {len(hashes)}, Sources: {sources}")
-        
-        all_actions_del = []
-        all_actions_nodel = []
-        
-        # Process history torrents if they exist
-        if hashes:
-            hist_del, hist_nodel = self.process_history_torrents(media, item_id, hashes, sources)
-            all_actions_del.extend(hist_del)
-            all_actions_nodel.extend(hist_nodel)
-        
-        # Process manual import torrents
-        manual_del, manual_nodel = self.process_manual_import_torrents(media, item_id, sources)
-        all_actions_del.extend(manual_del)
-        all_actions_nodel.extend(manual_nodel)
-        
-        return all_actions_del, all_actions_nodel
-
-
+"""
+Module for managing automatic deletion of manually imported torrents.
+
+This module handles:
+1. Finding torrents that have been manually imported in Radarr/Sonarr
+2. Verifying they have exceeded the minimum seeding threshold
+3. Deleting torrents and associated files from qBittorrent
+4. Sending process notifications via Telegram
+
+Works with both history torrents (grabbed) and manual imports
+identified by sourceTitle in manual_import categories.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import lru_cache
+from typing import List, Dict, NamedTuple, Tuple, Optional
+
+import requests
+from requests.adapters import HTTPAdapter, Retry
+from app.logger import logger
+from utils.json_fast import json_loads
+
+# History responses are shared by the hash and source extractors and repeat
+# across back-to-back deletions in a batch; keep them briefly
+_HISTORY_TTL = 300
+
+# Full torrent listings barely change between items of the same batch
+_TORRENT_LIST_TTL = 60
+
+# Items with no history and no sources stay empty between scheduler passes
+_EMPTY_ITEM_TTL = 900
+_EMPTY_ITEM_CACHE_MAX = 4096
+
+# Translate dots/underscores to spaces in one C-level pass
+_NORM_TABLE = str.maketrans('._', '  ')
+
+# Video extensions stripped during normalization; a suffix check plus slice
+# beats invoking the regex engine in the per-file hot loop
+_VIDEO_EXTS = ('.mkv', '.mp4', '.avi', '.mov', '.wmv', '.m4a', '.flac')
+
+
+class ActionRecord(NamedTuple):
+    """Compact record of an action performed on a torrent"""
+    action: str
+    type: str
+    name: str
+    hash: str
+    reason: str = ''
+
+
+class DeleteManualImportManager:
+    """Manager for automatic deletion of manually imported torrents"""
+    
+    # Constants for action types and reasons
+    KEY_ACT_DEL = "DEL"
+    KEY_TYPE_HIST = "HIST"
+    KEY_TYPE_MATCH = "MATCH"
+    KEY_ACT_NODELETE = "NODELETE"
+    KEY_REASON_SEEDTIME_UNCOMPLETE = "SEEDTIME_UNCOMPLETE"
+    KEY_REASON_NO_MATCH = "NO_MATCH"
+    KEY_REASON_NOT_FOUND = "NOT_FOUND"
+    KEY_REASON_DRY_RUN = "DRY_RUN"
+    
+    # Seeding threshold in days
+    SEED_THRESHOLD_DAYS = 30
+    
+    # Torrent categories to analyze; frozensets for O(1) membership when
+    # filtering the full torrent listing
+    MOVIE_CATEGORIES = frozenset({
+        "manual_import_movies", "movies", "manual_import_prowlarr",
+        "movies.cross-seed", "manual_import_movies.cross-seed"
+    })
+    
+    TV_CATEGORIES = frozenset({
+        "manual_import_tv", "tv", "manual_import_prowlarr",
+        "tv.cross-seed", "manual_import_tv.cross-seed"
+    })
+    
+    def __init__(self, app_config):
+        """
+        Initialize the manager with application configuration
+        
+        Args:
+            app_config: Application configuration (ApplicationConfig)
+        """
+        self.app_config = app_config
+        self.dry_run = app_config.dry_run
+        
+        # Radarr configuration
+        if app_config.radarr_instances:
+            self.radarr_instance = app_config.radarr_instances[0]
+            self.radarr_session = self._build_session(
+                {'X-Api-Key': self.radarr_instance.api_key}
+            )
+        else:
+            logger.error("No Radarr instances configured")
+            self.radarr_instance = None
+            self.radarr_session = None
+        
+        # Sonarr configuration
+        if app_config.sonarr_instances:
+            self.sonarr_instance = app_config.sonarr_instances[0]
+            self.sonarr_session = self._build_session(
+                {'X-Api-Key': self.sonarr_instance.api_key}
+            )
+        else:
+            logger.error("No Sonarr instances configured")
+            self.sonarr_instance = None
+            self.sonarr_session = None
+        
+        # qBittorrent configuration
+        from utils.qbittorrent_connections import qbit_manager
+        self.qbittorrent_manager = qbit_manager
+
+        # Cache of raw history records keyed by (service, item_id), as
+        # (records, fetched_at); process_item runs in worker threads, so
+        # guard it with a lock
+        self._history_cache = {}
+        self._history_cache_lock = threading.Lock()
+
+        # Cache of the full torrent listing per qBittorrent instance name,
+        # as (torrents, fetched_at), shared under the same lock
+        self._torrent_list_cache = {}
+
+        # Cache of torrent file listings keyed by (instance name, hash),
+        # as (files, fetched_at); the same torrent recurs across items
+        self._files_cache = {}
+
+        # Negative cache: (media, item_id) -> recorded_at for items that
+        # came back with no history and no sources
+        self._empty_item_cache = {}
+        
+        if self.dry_run:
+            logger.info("🔍 DRY RUN MODE ACTIVATED - Torrents will not be actually deleted")
+    
+    @staticmethod
+    def _build_session(headers: Dict) -> requests.Session:
+        """
+        Build a pooled keep-alive session with retries for an Arr service
+        
+        Args:
+            headers: Default headers, including the API key
+            
+        Returns:
+            Configured requests session
+        """
+        session = requests.Session()
+        session.headers.update(headers)
+        adapter = HTTPAdapter(
+            pool_connections=8, pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=(429, 500, 502, 503, 504))
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def normalize(name: str) -> str:
+        """
+        Normalize a file/torrent name for comparison
+        
+        The same torrent and file names recur across candidates, sources
+        and re-runs, so the result is memoized; normalization is a pure
+        function of the name.
+        
+        Args:
+            name: Original file/torrent name
+            
+        Returns:
+            Normalized name (no extension, spaces instead of dots/dashes, lowercase)
+        """
+        name = os.path.basename(name)
+        lowered = name.lower()
+        suffix = next((ext for ext in _VIDEO_EXTS if lowered.endswith(ext)), None)
+        base = name[:-len(suffix)] if suffix else name
+        return base.translate(_NORM_TABLE).casefold().strip()
+    
+    @staticmethod
+    def create_action_dict(name: str, hash_value: str, action: str, type_value: str, reason: str = '') -> ActionRecord:
+        """
+        Create a record with information about an action performed
+        
+        Thousands of these can accumulate over a large batch; the tuple
+        layout is several times lighter than a dict per action. They are
+        converted to plain dicts at the process_item boundary, where the
+        notifier and the logs expect dict access.
+        
+        Args:
+            name: Torrent name
+            hash_value: Torrent hash
+            action: Action performed (DEL/NODELETE)
+            type_value: Action type (HIST/MATCH)
+            reason: Reason for the action
+            
+        Returns:
+            ActionRecord with action information
+        """
+        return ActionRecord(action, type_value, name, hash_value, reason)
+    
+    def list_all_torrents(self, qbit_instance) -> List[Dict]:
+        """
+        Get the full torrent listing of an instance, cached with a short TTL
+
+        One listing serves every category filter for the instance, instead
+        of one request per (instance, category) pair.
+
+        Args:
+            qbit_instance: qBittorrent instance
+
+        Returns:
+            List of all torrents on the instance
+        """
+        now = time.monotonic()
+        with self._history_cache_lock:
+            cached = self._torrent_list_cache.get(qbit_instance.name)
+            if cached is not None and now - cached[1] < _TORRENT_LIST_TTL:
+                return cached[0]
+
+        url = f"{qbit_instance.api_url}/api/v2/torrents/info?filter=all"
+        response = qbit_instance.session.get(url)
+        response.raise_for_status()
+        torrents = json_loads(response.content)
+
+        with self._history_cache_lock:
+            self._torrent_list_cache[qbit_instance.name] = (torrents, time.monotonic())
+        return torrents
+
+    def list_files_for_torrent(self, qbit_instance, torrent_hash: str) -> List[Dict]:
+        """
+        Get the list of files in a specific torrent, cached with a short TTL
+        
+        The same torrent is often revisited across the items of a batch;
+        its file list does not change in that window.
+        
+        Args:
+            qbit_instance: qBittorrent instance
+            torrent_hash: Torrent hash
+            
+        Returns:
+            List of files in the torrent
+        """
+        key = (qbit_instance.name, torrent_hash)
+        now = time.monotonic()
+        with self._history_cache_lock:
+            cached = self._files_cache.get(key)
+            if cached is not None and now - cached[1] < _TORRENT_LIST_TTL:
+                return cached[0]
+
+        url = f"{qbit_instance.api_url}/api/v2/torrents/files?hash={torrent_hash}"
+        response = qbit_instance.session.get(url)
+        response.raise_for_status()
+        files = json_loads(response.content)
+
+        with self._history_cache_lock:
+            self._files_cache[key] = (files, time.monotonic())
+        return files
+    
+    def _get_history_records(self, service: str, item_id: int) -> List[Dict]:
+        """
+        Get raw history records for an item, cached with a short TTL
+
+        One fetch serves both the hash and the source extractors, and
+        repeated process_item calls within the TTL reuse the response.
+
+        Args:
+            service: Service name ('radarr' or 'sonarr')
+            item_id: Movie ID or episode ID
+
+        Returns:
+            List of raw history records
+        """
+        key = (service, item_id)
+        now = time.monotonic()
+
+        with self._history_cache_lock:
+            cached = self._history_cache.get(key)
+            if cached is not None and now - cached[1] < _HISTORY_TTL:
+                return cached[0]
+
+        if service == 'radarr':
+            records = self._fetch_radarr_history(item_id)
+        else:
+            records = self._fetch_sonarr_history(item_id)
+
+        with self._history_cache_lock:
+            self._history_cache[key] = (records, time.monotonic())
+        return records
+
+    def _fetch_radarr_history(self, movie_id: int) -> List[Dict]:
+        """
+        Fetch the relevant Radarr history of a movie
+
+        Only 'grabbed' and 'downloadFolderImported' events are fetched,
+        filtered server-side; a long-lived movie accumulates far more
+        history overall and an unfiltered fetch would trip the abort bound.
+
+        Args:
+            movie_id: Movie ID
+
+        Returns:
+            List of grabbed and import history records
+        """
+        if not self.radarr_instance:
+            return []
+
+        url = f"{self.radarr_instance.api_url}/api/v3/history/movie"
+        records = []
+
+        for event_type in ('grabbed', 'downloadFolderImported'):
+            params = {'movieId': movie_id, 'eventType': event_type}
+            try:
+                response = self.radarr_session.get(url, params=params, timeout=(5, 30))
+                response.raise_for_status()
+                history_data = json_loads(response.content)
+
+                # Per-type bound, as before the fetches were combined; drop
+                # only the offending type so the other still gets processed
+                if len(history_data) > 20:
+                    logger.error(f"Too many records in Radarr history "
+                                 f"({event_type}: {len(history_data)}), aborting")
+                    continue
+
+                records.extend(history_data)
+
+            except requests.RequestException as e:
+                logger.error(f"Error getting Radarr history ({event_type}): {e}")
+
+        return records
+
+    def _fetch_sonarr_history(self, episode_id: int) -> List[Dict]:
+        """
+        Fetch the full Sonarr history of an episode
+
+        Args:
+            episode_id: Episode ID
+
+        Returns:
+            List of history records (all event types)
+        """
+        if not self.sonarr_instance:
+            return []
+
+        url = f"{self.sonarr_instance.api_url}/api/v3/history"
+        # Bound the page server-side: the abort guard only needs to know
+        # whether more than 10 records exist, so never transfer more than 11
+        params = {'episodeId': episode_id, 'pageSize': 11, 'page': 1}
+
+        try:
+            response = self.sonarr_session.get(url, params=params, timeout=(5, 30))
+            response.raise_for_status()
+            data = json_loads(response.content)
+
+            records = data.get('records', [])
+            if int(data.get('totalRecords', 11)) > 10:
+                logger.error(f"Too many records in Sonarr history ({len(records)}), aborting")
+                return []
+
+            return records
+
+        except requests.RequestException as e:
+            logger.error(f"Error getting Sonarr history: {e}")
+            return []
+
+    def _get_history_lists(self, service: str, item_id: int) -> Tuple[List[str], List[str]]:
+        """
+        Split an item's history into grabbed hashes and import sources
+        
+        One sweep over the cached records builds both lists.
+        
+        Args:
+            service: Service name ('radarr' or 'sonarr')
+            item_id: Movie ID or episode ID
+            
+        Returns:
+            Tuple with (grabbed hashes, normalized import sources)
+        """
+        hashes = []
+        sources = []
+        for entry in self._get_history_records(service, item_id):
+            event_type = entry.get('eventType')
+            if event_type == 'grabbed' and entry.get('downloadId'):
+                hashes.append(entry['downloadId'])
+            elif event_type == 'downloadFolderImported' and entry.get('sourceTitle'):
+                sources.append(self.normalize(entry['sourceTitle']))
+        return hashes, sources
+
+    def get_radarr_history_hashes(self, movie_id: int) -> List[str]:
+        """
+        Get torrent hashes 'grabbed' from Radarr history
+        
+        Args:
+            movie_id: Movie ID
+            
+        Returns:
+            List of downloaded torrent hashes
+        """
+        return self._get_history_lists('radarr', movie_id)[0]
+    
+    def get_radarr_import_sources(self, movie_id: int) -> List[str]:
+        """
+        Get sourceTitles from Radarr manual imports
+        
+        Args:
+            movie_id: Movie ID
+            
+        Returns:
+            List of normalized titles of imported files
+        """
+        return self._get_history_lists('radarr', movie_id)[1]
+    
+    def get_sonarr_history_hashes(self, episode_id: int) -> List[str]:
+        """
+        Get torrent hashes 'grabbed' from Sonarr history
+        
+        Args:
+            episode_id: Episode ID
+            
+        Returns:
+            List of downloaded torrent hashes
+        """
+        return self._get_history_lists('sonarr', episode_id)[0]
+    
+    def get_sonarr_import_sources(self, episode_id: int) -> List[str]:
+        """
+        Get sourceTitles from Sonarr manual imports
+        
+        Args:
+            episode_id: Episode ID
+            
+        Returns:
+            List of normalized titles of imported files
+        """
+        return self._get_history_lists('sonarr', episode_id)[1]
+    
+    def delete_torrent_from_qbittorrent(self, qbit_instance, torrent_hash: str, torrent_name: str) -> bool:
+        """
+        Delete a torrent from qBittorrent
+        
+        Args:
+            qbit_instance: qBittorrent instance
+            torrent_hash: Hash of the torrent to delete
+            torrent_name: Torrent name (for logs)
+            
+        Returns:
+            True if deleted successfully, False otherwise
+        """
+        if self.dry_run:
+            logger.info(f"🔍 DRY RUN: Would delete torrent {torrent_name} ({torrent_hash}) from {qbit_instance.name}")
+            return True
+        
+        try:
+            response = qbit_instance.session.post(
+                f"{qbit_instance.api_url}/api/v2/torrents/delete",
+                data={"hashes": torrent_hash, "deleteFiles": True}
+            )
+            
+            if response.ok:
+                logger.info(f"✅ Torrent deleted: {torrent_name} ({torrent_hash}) from {qbit_instance.name}")
+                self._invalidate_torrent_caches(qbit_instance.name, torrent_hash)
+                return True
+            else:
+                logger.error(f"❌ Error deleting torrent {torrent_hash}: {response.status_code} {response.text}")
+                return False
+                
+        except requests.RequestException as e:
+            logger.error(f"❌ Connection error deleting torrent {torrent_hash}: {e}")
+            return False
+    
+    def _invalidate_torrent_caches(self, instance_name: str, torrent_hash: str):
+        """
+        Drop cached listings that a deletion has made stale
+        
+        Args:
+            instance_name: Name of the qBittorrent instance
+            torrent_hash: Hash of the deleted torrent
+        """
+        with self._history_cache_lock:
+            self._torrent_list_cache.pop(instance_name, None)
+            self._files_cache.pop((instance_name, torrent_hash), None)
+    
+    def process_history_torrents(self, media: str, item_id: int, hashes: List[str], sources: List[str]) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Process history torrents (grabbed) for deletion
+        
+        Args:
+            media: Media type ('radarr' or 'sonarr')
+            item_id: Item ID (movie_id or episode_id)
+            hashes: List of hashes from history
+            sources: List of sources for logging
+            
+        Returns:
+            Tuple with (deleted_actions, non_deleted_actions)
+        """
+        res_actions_del = []
+        res_actions_nodel = []
+        
+        if not hashes:
+            return res_actions_del, res_actions_nodel
+        
+        logger.info(f"🔍 Processing {len(hashes)} history torrents for {media} {item_id}")
+        
+        # Remove duplicates once, preserving order; the tuple is reused as-is
+        # by every instance instead of rebuilding a list per loop iteration
+        unique_hashes = tuple(dict.fromkeys(hashes))
+        source_name = sources[0] if sources else f"Unknown-{item_id}"
+        
+        for qbit_instance in self.qbittorrent_manager.get_all_instances():
+            # Login only once per instance
+            qbit_instance.login()
+            
+            # Get seeding information for all hashes
+            torrents_info = qbit_instance.get_torrent_info(unique_hashes) or []
+            
+            # Create a hash lookup dictionary
+            torrent_dict = {torrent['hash'].lower(): torrent for torrent in torrents_info}
+            
+            for hash_value in unique_hashes:
+                torrent_data = torrent_dict.get(hash_value.lower())
+                
+                if torrent_data:
+                    seed_days = torrent_data.get('seeding_time', 0) / 86400
+                    
+                    if seed_days >= self.SEED_THRESHOLD_DAYS:
+                        if self.delete_torrent_from_qbittorrent(qbit_instance, hash_value, source_name):
+                            reason = self.KEY_REASON_DRY_RUN if self.dry_run else ""
+                            res_actions_del.append(
+                                self.create_action_dict(source_name, hash_value, self.KEY_ACT_DEL, self.KEY_TYPE_HIST, reason)
+                            )
+                    else:
+                        logger.info(f"⏸️  Torrent {hash_value} seed={seed_days:.1f}d < {self.SEED_THRESHOLD_DAYS}d → skipped")
+                        res_actions_nodel.append(
+                            self.create_action_dict(source_name, hash_value, self.KEY_ACT_NODELETE, self.KEY_TYPE_HIST, self.KEY_REASON_SEEDTIME_UNCOMPLETE)
+                        )
+                else:
+                    # Torrent not found in this instance
+                    logger.info(f"⏸️  Torrent {hash_value} seed=0.0d < {self.SEED_THRESHOLD_DAYS}d → skipped")
+                    res_actions_nodel.append(
+                        self.create_action_dict(source_name, hash_value, self.KEY_ACT_NODELETE, self.KEY_TYPE_HIST, f"{self.KEY_REASON_NOT_FOUND} {qbit_instance.name}")
+                    )
+        
+        return res_actions_del, res_actions_nodel
+    
+    def find_manual_import_matches(self, sources: List[str], categories: frozenset) -> List[Tuple]:
+        """
+        Find ALL torrents that match manually imported files (including cross-seeds)
+        
+        Args:
+            sources: List of normalized sources
+            categories: Set of categories to search
+            
+        Returns:
+            List of tuples (instance, torrent, reason) for all matches found
+        """
+        if not sources:
+            return []
+        
+        # Collect all candidate torrents: one listing per instance,
+        # filtered by category locally, instead of one request per
+        # (instance, category) pair. Instances are independent hosts, so
+        # list them concurrently.
+        def _instance_candidates(qbit_instance):
+            # Login once per instance
+            qbit_instance.login()
+            try:
+                return [
+                    (qbit_instance, torrent)
+                    for torrent in self.list_all_torrents(qbit_instance)
+                    if torrent.get('category') in categories
+                ]
+            except Exception as e:
+                logger.warning(f"Error getting torrents from {qbit_instance.name}: {e}")
+                return []
+
+        candidates = []
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for instance_candidates in executor.map(
+                _instance_candidates, self.qbittorrent_manager.get_all_instances()
+            ):
+                candidates.extend(instance_candidates)
+        
+        # Normalize sources for comparison. Matching is deliberately exact
+        # on normalized names: fuzzy scoring could pair a source with the
+        # wrong release and this path ends in deletion, so near-misses fall
+        # through to the (slower but precise) per-file pass instead.
+        normalized_sources = set(sources)
+        logger.debug(f"🔍 Searching for matches for sources: {normalized_sources}")
+        
+        matches = []
+        matched_hashes = set()
+        normalize = self.normalize  # Local bind for the string-heavy loops
+        
+        # Search for exact match by torrent name: index candidates by
+        # normalized name once, then walk the (few) sources, instead of
+        # testing every candidate against the source set
+        name_to_entries = {}
+        for qbit_instance, torrent in candidates:
+            name_to_entries.setdefault(normalize(torrent['name']), []).append(
+                (qbit_instance, torrent)
+            )
+
+        for source in normalized_sources:
+            for qbit_instance, torrent in name_to_entries.get(source, ()):
+                matches.append((qbit_instance, torrent, f"name == {source!r}"))
+                matched_hashes.add(torrent['hash'])
+        
+        # Search for match in internal torrent files; the file listings are
+        # independent per torrent, fetch them concurrently. The matched-hash
+        # set makes the already-matched check O(1) instead of rescanning the
+        # match list per candidate.
+        # Dedupe by (instance, hash) so the same torrent is never listed
+        # twice, and skip torrents still below the seed threshold: the info
+        # listing already carries seeding_time, and a file match would be
+        # rejected by the seed check anyway, so their file listings are
+        # round-trips for nothing
+        seed_threshold_sec = self.SEED_THRESHOLD_DAYS * 86400
+        unmatched = list({
+            (qbit_instance.name, torrent['hash']): (qbit_instance, torrent)
+            for qbit_instance, torrent in candidates
+            if torrent['hash'] not in matched_hashes
+            and torrent.get('seeding_time', 0) >= seed_threshold_sec
+        }.values())
+
+        def _torrent_files(entry):
+            qbit_instance, torrent = entry
+            try:
+                return self.list_files_for_torrent(qbit_instance, torrent['hash'])
+            except Exception as e:
+                logger.warning(f"Error getting files for torrent {torrent['hash']}: {e}")
+                return []
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            file_lists = list(executor.map(_torrent_files, unmatched))
+
+        for (qbit_instance, torrent), files in zip(unmatched, file_lists):
+            # One C-level set intersection decides the torrent instead of a
+            # Python loop over its files; a torrent matches at most once
+            file_hits = {normalize(file_info['name']) for file_info in files} \
+                & normalized_sources
+            if file_hits:
+                matches.append((qbit_instance, torrent, f"file == {next(iter(file_hits))!r}"))
+        
+        logger.info(f"🎯 Found {len(matches)} matching torrents (including cross-seeds)")
+        return matches
+    
+    def process_manual_import_torrents(self, media: str, item_id: int, sources: List[str]) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Process manual import torrents for deletion (including cross-seeds)
+        
+        Args:
+            media: Media type ('radarr' or 'sonarr')
+            item_id: Item ID
+            sources: List of import sources
+            
+        Returns:
+            Tuple with (deleted_actions, not_deleted_actions)
+        """
+        res_actions_del = []
+        res_actions_nodel = []
+        
+        if not sources:
+            logger.debug(f"No sources for {media} {item_id}")
+            return res_actions_del, res_actions_nodel
+        
+        # Select categories based on media type
+        categories = self.MOVIE_CATEGORIES if media == 'radarr' else self.TV_CATEGORIES
+        
+        # Search for ALL matches (including cross-seeds)
+        matches = self.find_manual_import_matches(sources, categories)
+        
+        if not matches:
+            logger.debug(f"❌ No manual torrent matches found for {media} {item_id}")
+            res_actions_nodel.append(
+                self.create_action_dict(sources[0], "", self.KEY_ACT_NODELETE, self.KEY_TYPE_MATCH, self.KEY_REASON_NO_MATCH)
+            )
+            return res_actions_del, res_actions_nodel
+        
+        # One info request per instance covering every matched hash, instead
+        # of a round-trip per match
+        info_by_hash = {}
+        matches_by_instance = {}
+        for qbit_instance, torrent, reason in matches:
+            matches_by_instance.setdefault(
+                qbit_instance.name, (qbit_instance, [])
+            )[1].append(torrent['hash'])
+
+        for qbit_instance, hashes in matches_by_instance.values():
+            try:
+                for info in qbit_instance.get_torrent_info(hashes) or []:
+                    info_by_hash[(qbit_instance.name, info['hash'].lower())] = info
+            except Exception as e:
+                logger.error(f"Error getting torrent info from {qbit_instance.name}: {e}")
+
+        # Process each matching torrent
+        for match_index, (qbit_instance, torrent, reason) in enumerate(matches, 1):
+            logger.info(f"🎯 Processing match {match_index}/{len(matches)}: {torrent['name']} ({torrent['hash']}) in {qbit_instance.name} by {reason}")
+            
+            # Check seeding time
+            try:
+                torrent_data = info_by_hash.get(
+                    (qbit_instance.name, torrent['hash'].lower()), {}
+                )
+                seed_sec = torrent_data.get('seeding_time', 0)
+                seed_days = seed_sec / 86400
+                
+                logger.info(f"🎯 Match {match_index}: {torrent['name']} ({torrent['hash']}) in {qbit_instance.name} by {reason}; seed={seed_days:.1f}d")
+                
+                # Check seeding threshold
+                if seed_days < self.SEED_THRESHOLD_DAYS:
+                    logger.info(f"⏸️  Seed {seed_days:.1f}d < {self.SEED_THRESHOLD_DAYS}d → skipped")
+                    res_actions_nodel.append(
+                        self.create_action_dict(torrent['name'], torrent['hash'], self.KEY_ACT_NODELETE, self.KEY_TYPE_MATCH, self.KEY_REASON_SEEDTIME_UNCOMPLETE)
+                    )
+                    continue
+                
+                # Proceed with deletion
+                if self.delete_torrent_from_qbittorrent(qbit_instance, torrent['hash'], torrent['name']):
+                    reason_suffix = self.KEY_REASON_DRY_RUN if self.dry_run else ""
+                    res_actions_del.append(
+                        self.create_action_dict(torrent['name'], torrent['hash'], self.KEY_ACT_DEL, self.KEY_TYPE_MATCH, reason_suffix)
+                    )
+                else:
+                    res_actions_nodel.append(
+                        self.create_action_dict(torrent['name'], torrent['hash'], self.KEY_ACT_NODELETE, self.KEY_TYPE_MATCH, "ERROR_DELETE")
+                    )
+                    
+            except Exception as e:
+                logger.error(f"Error processing torrent {torrent['hash']}: {e}")
+                res_actions_nodel.append(
+                    self.create_action_dict(torrent['name'], torrent['hash'], self.KEY_ACT_NODELETE, self.KEY_TYPE_MATCH, f"ERROR: {str(e)}")
+                )
+        
+        return res_actions_del, res_actions_nodel
+    
+    def invalidate(self, media: str, item_id: int):
+        """
+        Forget cached state for an item, forcing fresh fetches
+        
+        Call when an event signals that the item's history has changed.
+        
+        Args:
+            media: Media type ('radarr' or 'sonarr')
+            item_id: Item ID (movie_id or episode_id)
+        """
+        with self._history_cache_lock:
+            self._empty_item_cache.pop((media, item_id), None)
+            self._history_cache.pop((media, item_id), None)
+    
+    def process_item(self, media: str, item_id: int) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Process an item (movie or episode) for torrent deletion
+        
+        Args:
+            media: Media type ('radarr' or 'sonarr')
+            item_id: Item ID (movie_id or episode_id)
+            
+        Returns:
+            Tuple with (deleted_actions, not_deleted_actions)
+        """
+        logger.info(f"🔄 Processing {media} item {item_id}")
+        
+        # Items known to have no history and no sources skip the Arr
+        # round-trip entirely for a while
+        now = time.monotonic()
+        with self._history_cache_lock:
+            recorded_at = self._empty_item_cache.get((media, item_id))
+            if recorded_at is not None and now - recorded_at < _EMPTY_ITEM_TTL:
+                logger.debug(f"Item {media} {item_id} recently empty, skipping")
+                return [], []
+        
+        # Get history and sources based on media type, both built from one
+        # sweep over the cached history
+        hashes, sources = self._get_history_lists(media, item_id)
+        if not hashes and not sources:
+            with self._history_cache_lock:
+                if len(self._empty_item_cache) >= _EMPTY_ITEM_CACHE_MAX:
+                    self._empty_item_cache.clear()  # Crude but rarely reached eviction
+                self._empty_item_cache[(media, item_id)] = time.monotonic()
+        if media == 'radarr':
+            logger.debug(f"📚 Radarr - Hashes: {len(hashes)}, Sources: {sources}")
+        else:  # sonarr
+            logger.debug(f"📺 Sonarr - Hashes: {len(hashes)}, Sources: {sources}")
+        
+        all_actions_del = []
+        all_actions_nodel = []
+        
+        # Process history torrents if they exist
+        if hashes:
+            hist_del, hist_nodel = self.process_history_torrents(media, item_id, hashes, sources)
+            all_actions_del.extend(hist_del)
+            all_actions_nodel.extend(hist_nodel)
+        
+        # Process manual import torrents
+        manual_del, manual_nodel = self.process_manual_import_torrents(media, item_id, sources)
+        all_actions_del.extend(manual_del)
+        all_actions_nodel.extend(manual_nodel)
+        
+        # Serialization boundary: callers and the notifier read these as dicts
+        return (
+            [action._asdict() for action in all_actions_del],
+            [action._asdict() for action in all_actions_nodel]
+        )
+
+
@@ -0,0 +1,58 @@
+"""
+Fast JSON Helpers
+
+This module centralizes JSON encoding/decoding for the MediaHook application.
+It uses orjson when available (2-3x faster loads, ~10x faster dumps than the
+standard library) and transparently falls back to stdlib json so the
+application keeps working if orjson is not installed.
+
+Functions:
+    json_loads: Decode JSON from str/bytes
+    json_dumps: Encode an object to a JSON string, with optional indentation
+
+All webhook parsing and debug serialization paths should go through these
+helpers instead of importing json directly.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Whether the fast orjson backend is active
+ORJSON_AVAILABLE = orjson is not None
+
+
+def json_loads(data):
+    """
+    Decode a JSON document using the fastest available backend
+
+    Args:
+        data (str or bytes): JSON document to decode
+
+    Returns:
+        The decoded Python object (dict, list, etc.)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj, indent=None):
+    """
+    Encode an object as a JSON string using the fastest available backend
+
+    Args:
+        obj: Object to serialize
+        indent (int): Optional indentation. orjson only supports 2-space
+                      indentation, so any truthy value maps to 2 spaces there.
+
+    Returns:
+        str: JSON string representation of the object
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode('utf-8')
+    return json.dumps(obj, indent=indent)
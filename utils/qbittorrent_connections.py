@@ -18,9 +18,14 @@ access to torrent operations across different servers.
 """
 
 import requests
-import json
-from datetime import datetime, timedelta
+import time
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from app.logger import logger
+from utils.json_fast import json_loads
+
+# Hashes seen in a torrents/info response are considered present this long
+_HASH_CACHE_TTL = 60
 
 class QBittorrentManager:
     """
@@ -74,9 +79,13 @@ class QBittorrentManager:
         return list(self.instances.values())
     
     def login_all(self):
-        """Log in to all instances"""
-        for instance in self.instances.values():
-            instance.login()
+        """Log in to all instances concurrently"""
+        if not self.instances:
+            return
+        # Each instance owns its session, so parallel logins are safe and
+        # startup waits for the slowest handshake instead of the sum of all
+        with ThreadPoolExecutor(max_workers=min(8, len(self.instances))) as executor:
+            list(executor.map(lambda instance: instance.login(), self.instances.values()))
 
 class QBittorrentInstance:
     """
@@ -109,7 +118,16 @@ class QBittorrentInstance:
         self.password = config.password
         self.seed_limit = config.seed_limit
         self.session = requests.Session()
+        # Keep the authenticated connection alive between calls; two pooled
+        # sockets cover the occasional overlapping request per instance
+        self.session.headers['Connection'] = 'keep-alive'
+        adapter = HTTPAdapter(pool_maxsize=2)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         self.authenticated = False
+        # Known-present hashes: hash -> expiry timestamp, refreshed whenever a
+        # torrents/info response mentions the hash
+        self._hash_cache = {}
         
         logger.info(f"Configured qBittorrent instance: {self}")
     
@@ -136,6 +154,7 @@ class QBittorrentInstance:
             if response.text == "Ok.":
                 self.authenticated = True
                 logger.info(f"Successful login to {self.name}")
+                self._warm_up()
             else:
                 logger.error(f"Authentication error on {self.name}: {response.text}")
                 self.authenticated = False
@@ -143,7 +162,20 @@ class QBittorrentInstance:
         except requests.RequestException as e:
             logger.error(f"Error connecting to {self.name}: {e}")
             self.authenticated = False
-    
+
+    def _warm_up(self):
+        """
+        Prime the pooled connection right after login
+
+        A tiny app/version GET keeps the freshly authenticated TCP+TLS state
+        warm so the first real call does not pay the connection setup again.
+        Failures are harmless and only logged at debug level.
+        """
+        try:
+            self.session.get(f"{self.api_url}/api/v2/app/version", timeout=(3, 5))
+        except requests.RequestException as e:
+            logger.debug(f"Warm-up request to {self.name} failed: {e}")
+
     def get_torrent_info(self, hashes):
         """
         Get torrent information by their hashes
@@ -156,21 +188,35 @@ class QBittorrentInstance:
         """
         if not self.authenticated:
             self.login()
-            
+
         if not self.authenticated:
             logger.error(f"Could not authenticate to {self.name}")
             return []
-        
+
         try:
             params = {'hashes': '|'.join(hashes)}
             response = self.session.get(f"{self.api_url}/api/v2/torrents/info", params=params)
             response.raise_for_status()
-            
-            torrents = response.json()
+
+            torrents = json_loads(response.content)
             logger.debug(f"Retrieved information for {len(torrents)} torrents from {self.name}")
-            
-            return torrents
-            
+
+            # Keep only the fields consumed downstream; the full torrents/info
+            # payload carries dozens of keys per torrent we never read
+            projected = [{
+                'hash': torrent['hash'],
+                'name': torrent.get('name', ''),
+                'completion_on': torrent.get('completion_on', 0),
+                'seeding_time': torrent.get('seeding_time', 0)
+            } for torrent in torrents]
+
+            # Remember which hashes this instance holds for a short while
+            expiry = time.time() + _HASH_CACHE_TTL
+            for torrent in projected:
+                self._hash_cache[torrent['hash']] = expiry
+
+            return projected
+
         except requests.RequestException as e:
             logger.error(f"Error getting torrent info from {self.name}: {e}")
             return []
@@ -178,32 +224,48 @@ class QBittorrentInstance:
     def add_tag_to_delete(self, hashes):
         """
         Add the 'to_delete' tag to specified torrents
-        
+
         Args:
             hashes: List of torrent hash strings to tag
-            
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        return self.add_tag_to_delete_joined('|'.join(hashes), len(hashes))
+
+    def add_tag_to_delete_joined(self, joined_hashes, count):
+        """
+        Add the 'to_delete' tag using an already-joined hash string
+
+        Callers that have computed the '|'-joined batch once can pass it
+        here directly instead of re-joining per call.
+
+        Args:
+            joined_hashes: Torrent hashes pre-joined with '|'
+            count: Number of hashes in the batch (for logging)
+
         Returns:
             bool: True if successful, False otherwise
         """
         if not self.authenticated:
             self.login()
-            
+
         if not self.authenticated:
             logger.error(f"Could not authenticate to {self.name}")
             return False
-        
+
         try:
             data = {
-                'hashes': '|'.join(hashes),
+                'hashes': joined_hashes,
                 'tags': 'to_delete'
             }
-            
+
             response = self.session.post(f"{self.api_url}/api/v2/torrents/addTags", data=data)
             response.raise_for_status()
-            
-            logger.info(f"Tag 'to_delete' added to {len(hashes)} torrents in {self.name}")
+
+            logger.info(f"Tag 'to_delete' added to {count} torrents in {self.name}")
             return True
-            
+
         except requests.RequestException as e:
             logger.error(f"Error adding tag in {self.name}: {e}")
             return False
@@ -211,69 +273,91 @@ class QBittorrentInstance:
     def verify_torrents(self, hashes):
         """
         Verify if torrents exist in this instance
-        
+
         Args:
             hashes: List of torrent hash strings to verify
-            
+
         Returns:
-            List of hashes that were found in this instance
+            Tuple of (set of hashes found in this instance, list of the
+            torrent info dicts fetched for the cache misses)
         """
-        torrents = self.get_torrent_info(hashes)
-        found_hashes = [torrent['hash'] for torrent in torrents]
-        
+        # Hashes recently confirmed present need no HTTP round-trip; only the
+        # unknown remainder is queried (a miss here never means absence)
+        now = time.time()
+        hash_cache = self._hash_cache
+        cached_found = {h for h in hashes if hash_cache.get(h, 0) > now}
+        to_check = [h for h in hashes if h not in cached_found]
+
+        torrents = self.get_torrent_info(to_check) if to_check else []
+        found_hashes = cached_found | {torrent['hash'] for torrent in torrents}
+
         logger.debug(f"Verified {len(found_hashes)} of {len(hashes)} torrents in {self.name}")
-        return found_hashes
+        return found_hashes, torrents
     
-    def add_to_delete_respecting_seedtime(self, hashes):
+    def add_to_delete_respecting_seedtime(self, hashes, torrents=None):
         """
         Add to_delete tag respecting seed time
-        
+
         Analyzes each torrent's seed time and only tags for deletion those
         that have exceeded the configured seed limit.
-        
+
         Args:
             hashes: List of torrent hash strings to process
-            
+            torrents: Optional pre-fetched torrent info (e.g. from a prior
+                      verify_torrents call) to skip the torrents/info request
+
         Returns:
             List of dictionaries with action results for each torrent
         """
         if not hashes:
             return []
-        
-        torrents = self.get_torrent_info(hashes)
+
+        if torrents is None:
+            torrents = self.get_torrent_info(hashes)
+        else:
+            # Pre-fetched info may cover a wider batch; keep the requested set
+            # and fetch any requested hashes it does not cover (e.g. hashes
+            # the verify round satisfied from its presence cache)
+            wanted = set(hashes)
+            torrents = [t for t in torrents if t['hash'] in wanted]
+            missing = wanted.difference(t['hash'] for t in torrents)
+            if missing:
+                torrents += self.get_torrent_info(list(missing))
         if not torrents:
             return []
         
         results = []
-        
-        for torrent in torrents:
-            try:
-                # Calculate seed time
-                completed_time = datetime.fromtimestamp(torrent.get('completion_on', 0))
-                current_time = datetime.now()
-                seed_time = current_time - completed_time
-                
-                # Check if it has exceeded the seed limit
-                if seed_time.total_seconds() >= self.seed_limit:
-                    if self.add_tag_to_delete([torrent['hash']]):
-                        results.append({
-                            'hash': torrent['hash'],
-                            'name': torrent['name'],
-                            'action': 'tagged_for_deletion',
-                            'seed_time_hours': seed_time.total_seconds() / 3600
-                        })
-                else:
-                    results.append({
-                        'hash': torrent['hash'],
-                        'name': torrent['name'],
-                        'action': 'seed_time_not_reached',
-                        'seed_time_hours': seed_time.total_seconds() / 3600,
-                        'required_hours': self.seed_limit / 3600
-                    })
-                    
-            except Exception as e:
-                logger.error(f"Error processing torrent {torrent.get('hash', 'unknown')}: {e}")
-        
+        # Plain epoch arithmetic; completion_on is already a unix timestamp,
+        # so there is no need to round-trip through datetime objects
+        now_ts = time.time()
+        seed_limit = self.seed_limit
+
+        try:
+            # Compute seed seconds once, then partition with comprehensions
+            enriched = [(t, now_ts - t.get('completion_on', 0)) for t in torrents]
+            eligible = [(t, s) for t, s in enriched if s >= seed_limit]
+            ineligible = [(t, s) for t, s in enriched if s < seed_limit]
+
+            # One addTags call covers every eligible torrent
+            if eligible and self.add_tag_to_delete([t['hash'] for t, _ in eligible]):
+                results = [{
+                    'hash': torrent['hash'],
+                    'name': torrent['name'],
+                    'action': 'tagged_for_deletion',
+                    'seed_time_hours': seed_seconds / 3600
+                } for torrent, seed_seconds in eligible]
+
+            results += [{
+                'hash': torrent['hash'],
+                'name': torrent['name'],
+                'action': 'seed_time_not_reached',
+                'seed_time_hours': seed_seconds / 3600,
+                'required_hours': seed_limit / 3600
+            } for torrent, seed_seconds in ineligible]
+
+        except Exception as e:
+            logger.error(f"Error processing torrents in {self.name}: {e}")
+
         return results
 
 # Global variables for compatibility
@@ -314,19 +398,39 @@ def set_to_delete_tag(hash_list):
         return
     
     logger.info(f"Processing {len(hash_list)} hashes for deletion tagging")
-    
-    # Try with all instances until finding the torrents
-    for instance in qbit_manager.get_all_instances():
-        found_hashes = instance.verify_torrents(hash_list)
-        if found_hashes:
-            logger.info(f"Found {len(found_hashes)} torrents in {instance.name}")
-            instance.add_to_delete_respecting_seedtime(found_hashes)
-            
-            # Remove found hashes from list to avoid duplication
-            hash_list = [h for h in hash_list if h not in found_hashes]
-            
-            if not hash_list:
-                break
-    
-    if hash_list:
-        logger.warning(f"Could not find {len(hash_list)} hashes in any qBittorrent instance")
+
+    instances = qbit_manager.get_all_instances()
+
+    # Probe every instance in parallel instead of waiting on each in turn,
+    # so total verify latency is that of the slowest instance. Each instance
+    # sees exactly one torrents/info call for the whole batch and exactly one
+    # tagging dispatch afterwards — nothing is re-sent as the list shrinks.
+    with ThreadPoolExecutor(max_workers=min(8, len(instances))) as executor:
+        verify_results = list(executor.map(
+            lambda instance: instance.verify_torrents(hash_list), instances
+        ))
+
+        # Assign each hash to the first instance that reported it, preserving
+        # the old sequential loop's de-duplication order. Set operations keep
+        # this O(N+M) rather than rescanning the list per membership check.
+        remaining = set(hash_list)
+        to_tag = []
+        for instance, (found_hashes, torrents) in zip(instances, verify_results):
+            found = found_hashes & remaining
+            if found:
+                logger.info(f"Found {len(found)} torrents in {instance.name}")
+                to_tag.append((instance, list(found), torrents))
+                remaining -= found
+
+        # Tag the disjoint per-instance sets concurrently as well, reusing
+        # the torrent info already fetched during the verify round
+        if to_tag:
+            list(executor.map(
+                lambda args: args[0].add_to_delete_respecting_seedtime(
+                    args[1], torrents=args[2]
+                ),
+                to_tag
+            ))
+
+    if remaining:
+        logger.warning(f"Could not find {len(remaining)} hashes in any qBittorrent instance")
@@ -1,348 +1,597 @@
-"""
-Telegram Notification Manager
-
-This module provides comprehensive Telegram notification functionality
-for the MediaHook application. It handles sending formatted messages
-for Sonarr and Radarr events, including media additions, deletions,
-updates, and auto        if del_actions or no_del_actions:
-            res_message = f"{self.texts['qbittorrent']['deletion_results']}\n\n"
-            
-            if del_actions:
-                res_message += f"{self.texts['qbittorrent']['deleted_section']}\n"
-                for action in del_actions:
-                    if action and action.get('action') == KEY_ACT_DEL:
-                        torrent_name = action.get('name', 'Unknown torrent')
-                        torrent_hash = action.get('hash', '')[:8]  # Show first 8 chars of hash
-                        res_message += f"  🗑️ {torrent_name} ({torrent_hash}...)\n"
-                res_message += "\n"
-            
-            if no_del_actions:
-                res_message += f"{self.texts['qbittorrent']['not_deleted_section']}\n"management results.
-
-Classes:
-    TelegramNotifier: Main class for handling Telegram notifications
-
-Functions:
-    Compatibility functions for backward compatibility with existing code
-
-The module supports rich HTML formatting, image attachments, and
-different chat channels for different types of notifications.
-"""
-
-import json
-import os
-import requests
-from pathlib import Path
-from app.logger import logger
-from utils.utils import bytes_to_gb
-
-class TelegramNotifier:
-    """
-    Class for handling Telegram notifications
-    
-    This class manages all Telegram communications for the MediaHook application,
-    providing methods to send formatted notifications for various media events
-    including series additions, movie updates, and torrent management results.
-    
-    Attributes:
-        app_config: Application configuration object
-        telegram_config: Telegram-specific configuration
-        token: Telegram bot token
-        chat_id: Main chat ID for notifications
-        private_chat_id: Private chat ID for qBittorrent messages
-        base_url: Base URL for Telegram API
-        send_message_url: URL for sending text messages
-        send_photo_url: URL for sending photo messages
-        texts: Customizable text strings for notifications
-    """
-    
-    def __init__(self, app_config):
-        """
-        Initialize the Telegram notifier
-        
-        Args:
-            app_config: Application configuration containing Telegram settings
-        """
-        self.app_config = app_config
-        self.telegram_config = app_config.telegram
-        self.token = self.telegram_config.token
-        self.chat_id = self.telegram_config.chat_id
-        self.private_chat_id = self.telegram_config.private_chat_id
-        
-        # Base URLs for Telegram API
-        self.base_url = f"https://api.telegram.org/bot{self.token}"
-        self.send_message_url = f"{self.base_url}/sendMessage"
-        self.send_photo_url = f"{self.base_url}/sendPhoto"
-        
-        # Load customizable texts
-        self.texts = self._load_telegram_texts()
-    
-    def _load_telegram_texts(self):
-        """
-        Load customizable text strings from telegram_texts.json
-        Tries to load language-specific file first, then falls back to generic file
-        
-        Returns:
-            dict: Dictionary containing customizable text strings
-        """
-        # Default texts (fallback)
-        default_texts = {
-            "sonarr": {
-                "series_added": "📺 <b>Series added:</b>",
-                "series_updated": "🔄 <b>Series updated:</b>",
-                "episodes_deleted": "🗑️ <b>Episodes deleted:</b>"
-            },
-            "radarr": {
-                "movie_added": "📢 <b>Movie added:</b>",
-                "movie_updated": "📢 <b>Movie updated:</b>",
-                "movies_deleted": "🗑️ <b>Movies deleted:</b>",
-                "quality_label": "📡",
-                "audio_label": "🗣️",
-                "subtitles_label": "💬"
-            },
-            "qbittorrent": {
-                "deletion_results": "🧹 <b>Torrent deletion results:</b>",
-                "deleted_section": "✅ <b>Deleted:</b>",
-                "not_deleted_section": "❌ <b>Not deleted:</b>"
-            }
-        }
-        
-        try:
-            config_dir = Path(os.path.dirname(os.path.abspath(__file__))) / '../config'
-            
-            # Get language from configuration
-            language = None
-            if hasattr(self.app_config, 'tmdb') and hasattr(self.app_config.tmdb, 'display_language'):
-                language = self.app_config.tmdb.display_language
-                logger.debug(f"Using language from config: {language}")
-            
-            # Try language-specific file first (e.g., telegram_texts.es.json)
-            if language:
-                lang_specific_path = config_dir / f'telegram_texts.{language}.json'
-                if lang_specific_path.exists():
-                    with open(lang_specific_path, 'r', encoding='utf-8') as f:
-                        custom_texts = json.load(f)
-                    logger.debug(f"Language-specific Telegram texts loaded: {lang_specific_path}")
-                    return custom_texts
-                else:
-                    logger.debug(f"Language-specific file not found: {lang_specific_path}")
-            
-            # Fallback to generic telegram_texts.json
-            generic_path = config_dir / 'telegram_texts.json'
-            if generic_path.exists():
-                with open(generic_path, 'r', encoding='utf-8') as f:
-                    custom_texts = json.load(f)
-                logger.debug("Generic Telegram texts loaded successfully")
-                return custom_texts
-            else:
-                logger.warning(f"No Telegram texts file found, using defaults")
-                return default_texts
-                
-        except Exception as e:
-            logger.error(f"Error loading Telegram texts: {e}, using defaults")
-            return default_texts
-    
-    def send_sonarr_message(self, added, deleted, updated, deleted_size):
-        """
-        Send Sonarr notification to Telegram
-        
-        Args:
-            added: Dictionary of added series and episodes
-            deleted: Dictionary of deleted episodes
-            updated: Dictionary of updated episodes
-            deleted_size: Total size of deleted content in bytes
-        """
-        res_message = ""
-        
-        if added:
-            res_message += f"{self.texts['sonarr']['series_added']}\n"
-            for series, episodes in added.items():
-                res_message += f"    · <a href=\"{episodes[0]['imdbUrl']}\"><i>{series}</i></a>: "
-                res_message += ", ".join(f"S{episode['season']}E{episode['episode']}"
-                                           for episode in episodes)
-                res_message += "\n"
-            res_message += "\n"
-        
-        if updated:
-            res_message += f"{self.texts['sonarr']['series_updated']}\n"
-            for series, episodes in updated.items():
-                res_message += f"    · <a href=\"{episodes[0]['imdbUrl']}\"><i>{series}</i></a>: "
-                res_message += ", ".join(f"S{episode['season']}E{episode['episode']}"
-                                           for episode in episodes)
-                res_message += "\n"
-            res_message += "\n"
-        
-        if deleted:
-            res_message += f"{self.texts['sonarr']['episodes_deleted']}\n"
-            for series, episodes in deleted.items():
-                res_message += f"    · <a href=\"{episodes[0]['imdbUrl']}\"><i>{series}</i></a>: "
-                res_message += ", ".join(f"S{episode['season']}E{episode['episode']}"
-                                           for episode in episodes)
-                res_message += "\n"
-            res_message += "\n"
-        
-        if res_message:
-            self.send_message(res_message, parse_mode=True)
-    
-    def send_radarr_message(self, added, deleted, deleted_size, is_upgrade):
-        """
-        Send Radarr notification to Telegram
-        
-        Args:
-            added: Dictionary containing added movie information
-            deleted: List of deleted movies
-            deleted_size: Total size of deleted content in bytes
-            is_upgrade: Boolean indicating if this is an upgrade operation
-        """
-        if is_upgrade:
-            res_message = f"{self.texts['radarr']['movie_updated']}\n"
-        else:   
-            res_message = f"{self.texts['radarr']['movie_added']}\n"
-        res_message += f"    · <a href=\"{added['imdbUrl']}\">{added['title']} ({added['year']})</a>\n"
-        res_message += f"      {self.texts['radarr']['quality_label']} {str(added['quality'])}\n"
-        res_message += f"      {self.texts['radarr']['audio_label']} {added['audio']}\n"
-        res_message += f"      {self.texts['radarr']['subtitles_label']} {added['subtitles']}\n\n"
-        
-        if deleted:
-            res_message += f"{self.texts['radarr']['movies_deleted']}\n"
-            for movie in deleted:
-                res_message += f"    · <a href=\"{movie['imdbUrl']}\">{movie['title']} ({movie['year']})</a>\n"
-        
-        self.send_message(res_message, parse_mode=True)
-    
-    def send_message(self, message, parse_mode=False):
-        """
-        Send a text message to Telegram
-        
-        Args:
-            message: Text message to send
-            parse_mode: Boolean indicating whether to use HTML parsing
-        """
-        try:
-            params = {
-                'chat_id': self.chat_id,
-                'text': message,
-                'disable_web_page_preview': False
-            }
-            
-            if parse_mode:
-                params['parse_mode'] = 'HTML'
-            
-            response = requests.get(self.send_message_url, params=params)
-            response.raise_for_status()
-            
-            logger.debug(f"Message sent to Telegram: {message[:100]}...")
-            
-        except requests.RequestException as e:
-            logger.error(f"Error sending message to Telegram: {e}")
-    
-    def send_image_message(self, message, image_url):
-        """
-        Send a message with image to Telegram
-        
-        Args:
-            message: Caption text for the image
-            image_url: URL of the image to send
-        """
-        try:
-            params = {
-                'chat_id': self.chat_id,
-                'photo': image_url,
-                'caption': message,
-                'parse_mode': 'HTML'
-            }
-            
-            response = requests.get(self.send_photo_url, params=params)
-            response.raise_for_status()
-            
-            logger.debug(f"Message with image sent to Telegram: {message[:100]}...")
-            
-        except requests.RequestException as e:
-            logger.error(f"Error sending message with image to Telegram: {e}")
-            # Fallback: send text only
-            self.send_message(message, parse_mode=True)
-    
-    def send_qbit_message(self, message):
-        """
-        Send a qBittorrent message to the private chat
-        
-        Args:
-            message: Message text to send to the private chat
-        """
-        try:
-            params = {
-                'chat_id': self.private_chat_id,
-                'text': message,
-                'parse_mode': 'HTML',
-                'disable_web_page_preview': True
-            }
-            
-            response = requests.get(self.send_message_url, params=params)
-            response.raise_for_status()
-            
-            logger.debug(f"qBittorrent message sent to Telegram: {message[:100]}...")
-            
-        except requests.RequestException as e:
-            logger.error(f"Error sending qBittorrent message to Telegram: {e}")
-    
-    def send_action_results(self, del_actions, no_del_actions):
-        """
-        Send deletion action results
-        
-        Args:
-            del_actions: List of successful deletion actions
-            no_del_actions: List of failed or skipped deletion actions
-        """
-        from utils.delete_manual_import import DeleteManualImportManager
-        
-        # Use class constants
-        KEY_ACT_DEL = DeleteManualImportManager.KEY_ACT_DEL
-        KEY_ACT_NODELETE = DeleteManualImportManager.KEY_ACT_NODELETE
-        
-        if del_actions or no_del_actions:
-            res_message = f"{self.texts['qbittorrent']['deletion_results']}\n\n"
-            
-            if del_actions:
-                res_message += f"{self.texts['qbittorrent']['deleted_section']}\n"
-                for action in del_actions:
-                    if action and action.get('action') == KEY_ACT_DEL:
-                        torrent_name = action.get('name', 'Unknown torrent')
-                        torrent_hash = action.get('hash', '')[:8]  # Show first 8 chars of hash
-                        res_message += f"   · {torrent_name} ({torrent_hash}...)\n"
-                res_message += "\n"
-            
-            if no_del_actions:
-                res_message += f"{self.texts['qbittorrent']['not_deleted_section']}\n"
-                
-                # Group by reason for better readability
-                reasons = {}
-                for action in no_del_actions:
-                    if action and action.get('action') == KEY_ACT_NODELETE:
-                        reason = action.get('reason', 'Unknown reason')
-                        torrent_name = action.get('name', 'Unknown torrent')
-                        torrent_hash = action.get('hash', '')[:8] if action.get('hash') else 'no-hash'
-                        
-                        if reason not in reasons:
-                            reasons[reason] = []
-                        reasons[reason].append(f"{torrent_name} ({torrent_hash}...)")
-                
-                for reason, torrents in reasons.items():
-                    res_message += f"   · <b>{reason}:</b>\n"
-                    for torrent in torrents:
-                        res_message += f"     - {torrent}\n"
-                    res_message += "\n"
-            
-            self.send_qbit_message(res_message)
-
-# Compatibility functions to maintain the previous interface
-def res_actions_send(res_actions_del, res_actions_no_del):
-    """
-    Compatibility function for action results
-    
-    Args:
-        res_actions_del: List of successful deletion actions
-        res_actions_no_del: List of failed or skipped deletion actions
-    """
-    from app.flask_app import app_config
-    notifier = TelegramNotifier(app_config)
-    notifier.send_action_results(res_actions_del, res_actions_no_del)
+"""
+Telegram Notification Manager
+
+This module provides comprehensive Telegram notification functionality
+for the MediaHook application. It handles sending formatted messages
+for Sonarr and Radarr events, including media additions, deletions,
+updates, and auto        if del_actions or no_del_actions:
+            res_message = f"{self.texts['qbittorrent']['deletion_results']}\n\n"
+            
+            if del_actions:
+                res_message += f"{self.texts['qbittorrent']['deleted_section']}\n"
+                for action in del_actions:
+                    if action and action.get('action') == KEY_ACT_DEL:
+                        torrent_name = action.get('name', 'Unknown torrent')
+                        torrent_hash = action.get('hash', '')[:8]  # Show first 8 chars of hash
+                        res_message += f"  🗑️ {torrent_name} ({torrent_hash}...)\n"
+                res_message += "\n"
+            
+            if no_del_actions:
+                res_message += f"{self.texts['qbittorrent']['not_deleted_section']}\n"management results.
+
+Classes:
+    TelegramNotifier: Main class for handling Telegram notifications
+
+Functions:
+    Compatibility functions for backward compatibility with existing code
+
+The module supports rich HTML formatting, image attachments, and
+different chat channels for different types of notifications.
+"""
+
+import functools
+import hashlib
+import html
+import os
+import queue
+import random
+import threading
+import time
+import requests
+from collections import defaultdict, OrderedDict
+from pathlib import Path
+from requests.adapters import HTTPAdapter, Retry
+from app.logger import logger
+from utils.json_fast import json_loads
+from utils.utils import bytes_to_gb
+
+# Action-type constants from the deletion manager, resolved once at import
+# time instead of per send_action_results call. The fallback literals keep
+# this module importable if the layout ever turns the import into a cycle.
+try:
+    from utils.delete_manual_import import DeleteManualImportManager as _DMI
+    _KEY_ACT_DEL = _DMI.KEY_ACT_DEL
+    _KEY_ACT_NODELETE = _DMI.KEY_ACT_NODELETE
+except ImportError:
+    _KEY_ACT_DEL = 'DEL'
+    _KEY_ACT_NODELETE = 'NODELETE'
+
+# Telegram sends are side-effects; webhook handlers should not block on them.
+# Public send_* methods enqueue work here and a daemon thread drains it.
+# A single worker is deliberate: it overlaps Telegram latency with webhook
+# handling while keeping outbound calls serialized, which naturally paces
+# them under Telegram's per-chat rate limits. The queue is bounded so a
+# stuck Telegram API cannot grow the backlog without limit.
+_TG_QUEUE = queue.Queue(maxsize=1000)
+
+# Webhook retries and bulk imports can emit the same notification twice in
+# quick succession; identical messages within this window are skipped
+_RECENT_TTL = 60.0
+_RECENT_MAX = 256
+
+
+def _enqueue(fn, args):
+    """Queue a send, dropping (with a warning) if the outbox is full."""
+    try:
+        _TG_QUEUE.put_nowait((fn, args))
+    except queue.Full:
+        logger.warning("Telegram outbox full, dropping notification")
+
+
+def _tg_worker():
+    """Drain queued Telegram sends, one at a time, forever."""
+    while True:
+        fn, args = _TG_QUEUE.get()
+        try:
+            fn(*args)
+        except Exception:
+            logger.exception("Error in background Telegram send")
+        finally:
+            _TG_QUEUE.task_done()
+
+
+threading.Thread(target=_tg_worker, daemon=True, name='telegram-sender').start()
+
+
+class _TokenBucket:
+    """
+    Adaptive token bucket used to pace sends per chat
+
+    Telegram allows roughly one message per second per chat. Each bucket
+    starts conservatively, speeds up a little on every success and backs
+    off sharply whenever the API answers 429.
+    """
+
+    __slots__ = ('rate', 'cap', 'tokens', 'updated')
+
+    def __init__(self, rate=1.0, cap=5.0):
+        self.rate = rate
+        self.cap = cap
+        self.tokens = cap
+        self.updated = time.monotonic()
+
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.cap, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1.0:
+                self.tokens -= 1.0
+                return
+            time.sleep((1.0 - self.tokens) / self.rate)
+
+    def on_success(self):
+        """Creep the refill rate up towards Telegram's global ceiling."""
+        self.rate = min(30.0, self.rate + 0.05)
+
+    def on_throttle(self):
+        """Halve the refill rate and drain the bucket after a 429."""
+        self.rate = max(0.2, self.rate * 0.5)
+        self.tokens = 0.0
+
+# Default texts (fallback)
+_DEFAULT_TEXTS = {
+    "sonarr": {
+        "series_added": "📺 <b>Series added:</b>",
+        "series_updated": "🔄 <b>Series updated:</b>",
+        "episodes_deleted": "🗑️ <b>Episodes deleted:</b>"
+    },
+    "radarr": {
+        "movie_added": "📢 <b>Movie added:</b>",
+        "movie_updated": "📢 <b>Movie updated:</b>",
+        "movies_deleted": "🗑️ <b>Movies deleted:</b>",
+        "quality_label": "📡",
+        "audio_label": "🗣️",
+        "subtitles_label": "💬"
+    },
+    "qbittorrent": {
+        "deletion_results": "🧹 <b>Torrent deletion results:</b>",
+        "deleted_section": "✅ <b>Deleted:</b>",
+        "not_deleted_section": "❌ <b>Not deleted:</b>"
+    }
+}
+
+
+@functools.lru_cache(maxsize=4)
+def _load_texts(language):
+    """
+    Load customizable text strings from telegram_texts.json, cached per language
+
+    Tries to load a language-specific file first, then falls back to the
+    generic file. The file rarely changes, so the parsed dict is cached and
+    every notifier instance for the same language shares it.
+
+    Args:
+        language: Display language code from the configuration, or None
+
+    Returns:
+        dict: Dictionary containing customizable text strings
+    """
+    try:
+        config_dir = Path(os.path.dirname(os.path.abspath(__file__))) / '../config'
+
+        # Try language-specific file first (e.g., telegram_texts.es.json)
+        if language:
+            lang_specific_path = config_dir / f'telegram_texts.{language}.json'
+            if lang_specific_path.exists():
+                custom_texts = json_loads(lang_specific_path.read_bytes())
+                logger.debug(f"Language-specific Telegram texts loaded: {lang_specific_path}")
+                return custom_texts
+            else:
+                logger.debug(f"Language-specific file not found: {lang_specific_path}")
+
+        # Fallback to generic telegram_texts.json
+        generic_path = config_dir / 'telegram_texts.json'
+        if generic_path.exists():
+            custom_texts = json_loads(generic_path.read_bytes())
+            logger.debug("Generic Telegram texts loaded successfully")
+            return custom_texts
+        else:
+            logger.warning(f"No Telegram texts file found, using defaults")
+            return _DEFAULT_TEXTS
+
+    except Exception as e:
+        logger.error(f"Error loading Telegram texts: {e}, using defaults")
+        return _DEFAULT_TEXTS
+
+
+class TelegramNotifier:
+    """
+    Class for handling Telegram notifications
+    
+    This class manages all Telegram communications for the MediaHook application,
+    providing methods to send formatted notifications for various media events
+    including series additions, movie updates, and torrent management results.
+    
+    Attributes:
+        app_config: Application configuration object
+        telegram_config: Telegram-specific configuration
+        token: Telegram bot token
+        chat_id: Main chat ID for notifications
+        private_chat_id: Private chat ID for qBittorrent messages
+        base_url: Base URL for Telegram API
+        send_message_url: URL for sending text messages
+        send_photo_url: URL for sending photo messages
+        texts: Customizable text strings for notifications
+    """
+    
+    def __init__(self, app_config):
+        """
+        Initialize the Telegram notifier
+        
+        Args:
+            app_config: Application configuration containing Telegram settings
+        """
+        self.app_config = app_config
+        self.telegram_config = app_config.telegram
+        self.token = self.telegram_config.token
+        self.chat_id = self.telegram_config.chat_id
+        self.private_chat_id = self.telegram_config.private_chat_id
+        
+        # Base URLs for Telegram API
+        self.base_url = f"https://api.telegram.org/bot{self.token}"
+        self.send_message_url = f"{self.base_url}/sendMessage"
+        self.send_photo_url = f"{self.base_url}/sendPhoto"
+
+        # Persistent session so consecutive sends reuse the TLS connection.
+        # Pool sized for notification bursts, with a short retry for flaky sends.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=4,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        )
+        self.session.mount('https://', adapter)
+        # Ask for compressed responses, like the Arr sessions do; gzip only,
+        # since no brotli decoder is shipped
+        self.session.headers.update({'Accept-Encoding': 'gzip'})
+
+        # Per-chat pacing buckets, created on first send to each chat
+        self._buckets = {}
+
+        # Recently sent (chat_id, message digest) -> send time, oldest first
+        self._recent = OrderedDict()
+
+        # Get language from configuration
+        language = None
+        if hasattr(app_config, 'tmdb') and hasattr(app_config.tmdb, 'display_language'):
+            language = app_config.tmdb.display_language
+            logger.debug(f"Using language from config: {language}")
+
+        # Load customizable texts (cached per language across instances)
+        self.texts = _load_texts(language)
+
+        # Message row templates built once instead of re-assembled per row
+        self._series_row_fmt = '    · <a href="{url}"><i>{name}</i></a>: {eps}\n'
+        self._movie_row_fmt = '    · <a href="{url}">{title} ({year})</a>\n'
+
+        # Base request params shared by every send; merged per call
+        self._msg_base = {
+            'chat_id': self.chat_id,
+            'parse_mode': 'HTML',
+            'disable_web_page_preview': False
+        }
+        self._photo_base = {
+            'chat_id': self.chat_id,
+            'parse_mode': 'HTML'
+        }
+        self._qbit_base = {
+            'chat_id': self.private_chat_id,
+            'parse_mode': 'HTML',
+            'disable_web_page_preview': True
+        }
+
+    def close(self):
+        """Release the pooled HTTP connections (call on app shutdown)"""
+        self.session.close()
+
+    def _post_with_retry(self, url, params, max_attempts=8):
+        """
+        POST to the Telegram API, honoring Retry-After and backing off
+
+        A 429 response sleeps for the interval the server asked for (plus
+        jitter) and does not consume an attempt; other transient failures
+        retry with capped exponential backoff and jitter.
+
+        Args:
+            url: Full API endpoint URL
+            params: Form parameters for the call
+            max_attempts: Attempts allowed for non-429 failures
+
+        Returns:
+            requests.Response: The successful response
+
+        Raises:
+            requests.RequestException: Once the attempts are exhausted
+        """
+        # Drop exact duplicates sent to the same chat within the TTL window
+        text = params.get('text') or params.get('caption')
+        recent_key = None
+        if text is not None:
+            digest = hashlib.blake2b(text.encode(), digest_size=16).digest()
+            recent_key = (params.get('chat_id'), digest)
+            now = time.monotonic()
+            recent = self._recent
+            while recent:
+                oldest_key = next(iter(recent))
+                if now - recent[oldest_key] > _RECENT_TTL:
+                    recent.popitem(last=False)
+                else:
+                    break
+            if recent_key in recent:
+                logger.debug("Skipping duplicate Telegram message")
+                return None
+
+        bucket = self._buckets.setdefault(params.get('chat_id'), _TokenBucket())
+        attempt = 0
+        while True:
+            bucket.acquire()
+            try:
+                response = self.session.post(url, data=params, timeout=(3, 10))
+                if response.status_code == 429:
+                    bucket.on_throttle()
+                    try:
+                        retry_after = float(
+                            json_loads(response.content)['parameters']['retry_after']
+                        )
+                    except (ValueError, KeyError, TypeError):
+                        try:
+                            retry_after = float(response.headers.get('Retry-After', 1))
+                        except ValueError:
+                            retry_after = 1.0
+                    logger.warning(f"Telegram rate limit hit, waiting {retry_after:.0f}s")
+                    time.sleep(retry_after + random.uniform(0, 0.5))
+                    continue  # Server-paced waits do not consume attempts
+                response.raise_for_status()
+                bucket.on_success()
+                if recent_key is not None:
+                    self._recent[recent_key] = time.monotonic()
+                    if len(self._recent) > _RECENT_MAX:
+                        self._recent.popitem(last=False)
+                return response
+            except requests.RequestException:
+                attempt += 1
+                if attempt >= max_attempts:
+                    raise
+                time.sleep(min(10.0, 0.5 * 2 ** attempt) + random.uniform(0, 0.5))
+
+    def send_sonarr_message(self, added, deleted, updated, deleted_size):
+        """
+        Send Sonarr notification to Telegram
+        
+        Args:
+            added: Dictionary of added series and episodes
+            deleted: Dictionary of deleted episodes
+            updated: Dictionary of updated episodes
+            deleted_size: Total size of deleted content in bytes
+        """
+        if not added and not updated and not deleted:
+            return
+
+        sonarr_texts = self.texts['sonarr']
+        parts = []
+
+        # (section header, series dict) pairs share the same row layout
+        sections = (
+            (sonarr_texts['series_added'], added),
+            (sonarr_texts['series_updated'], updated),
+            (sonarr_texts['episodes_deleted'], deleted),
+        )
+
+        series_row_fmt = self._series_row_fmt
+        for header, series_dict in sections:
+            if not series_dict:
+                continue
+            parts.append(f"{header}\n")
+            for series, episodes in series_dict.items():
+                # Escape user-controlled fields once per series, not per episode
+                parts.append(series_row_fmt.format(
+                    url=html.escape(episodes[0]['imdbUrl'], quote=True),
+                    name=html.escape(series),
+                    eps=", ".join(f"S{episode['season']}E{episode['episode']}"
+                                  for episode in episodes)
+                ))
+            parts.append("\n")
+
+        if parts:
+            self.send_message("".join(parts))
+    
+    def send_radarr_message(self, added, deleted, deleted_size, is_upgrade):
+        """
+        Send Radarr notification to Telegram
+        
+        Args:
+            added: Dictionary containing added movie information
+            deleted: List of deleted movies
+            deleted_size: Total size of deleted content in bytes
+            is_upgrade: Boolean indicating if this is an upgrade operation
+        """
+        # Without an added movie there is nothing to report (and the body
+        # below would crash indexing into it)
+        if not added:
+            return
+
+        radarr_texts = self.texts['radarr']
+        header = radarr_texts['movie_updated'] if is_upgrade else radarr_texts['movie_added']
+        movie_row_fmt = self._movie_row_fmt
+        parts = [
+            f"{header}\n",
+            movie_row_fmt.format(url=html.escape(added['imdbUrl'], quote=True),
+                                 title=html.escape(str(added['title'])), year=added['year']),
+            f"      {radarr_texts['quality_label']} {str(added['quality'])}\n",
+            f"      {radarr_texts['audio_label']} {added['audio']}\n",
+            f"      {radarr_texts['subtitles_label']} {added['subtitles']}\n\n",
+        ]
+
+        if deleted:
+            parts.append(f"{radarr_texts['movies_deleted']}\n")
+            for movie in deleted:
+                parts.append(movie_row_fmt.format(
+                    url=html.escape(movie['imdbUrl'], quote=True),
+                    title=html.escape(str(movie['title'])), year=movie['year']
+                ))
+
+        self.send_message("".join(parts))
+    
+    def send_message(self, message):
+        """
+        Queue a text message for Telegram (fire-and-forget)
+
+        Args:
+            message: Text message to send
+        """
+        _enqueue(self._send_message_sync, (message,))
+
+    def _send_message_sync(self, message):
+        """
+        Send a text message to Telegram
+
+        Args:
+            message: Text message to send
+        """
+        try:
+            params = {**self._msg_base, 'text': message}
+
+            self._post_with_retry(self.send_message_url, params)
+
+            logger.debug("Message sent to Telegram: %.100s...", message)
+            
+        except requests.RequestException as e:
+            logger.error(f"Error sending message to Telegram: {e}")
+    
+    def send_image_message(self, message, image_url):
+        """
+        Queue a message with image for Telegram (fire-and-forget)
+
+        Args:
+            message: Caption text for the image
+            image_url: URL of the image to send
+        """
+        _enqueue(self._send_image_message_sync, (message, image_url))
+
+    def _send_image_message_sync(self, message, image_url):
+        """
+        Send a message with image to Telegram
+
+        Args:
+            message: Caption text for the image
+            image_url: URL of the image to send
+        """
+        # Telegram caps photo captions at 1024 chars; a longer caption is a
+        # guaranteed 400, so go straight to a text message
+        if len(message) > 1024:
+            self._send_message_sync(message)
+            return
+
+        try:
+            params = {**self._photo_base, 'photo': image_url, 'caption': message}
+
+            self._post_with_retry(self.send_photo_url, params)
+
+            logger.debug("Message with image sent to Telegram: %.100s...", message)
+
+        except requests.HTTPError as e:
+            # Only photo-specific rejections fall back to text; 429/5xx were
+            # already retried with backoff inside _post_with_retry
+            status = e.response.status_code if e.response is not None else None
+            if status in (400, 413):
+                logger.warning(f"Telegram rejected the image ({status}), sending text only")
+                self._send_message_sync(message)
+            else:
+                logger.error(f"Error sending message with image to Telegram: {e}")
+        except requests.RequestException as e:
+            logger.error(f"Error sending message with image to Telegram: {e}")
+    
+    def send_qbit_message(self, message):
+        """
+        Queue a qBittorrent message for the private chat (fire-and-forget)
+
+        Args:
+            message: Message text to send to the private chat
+        """
+        _enqueue(self._send_qbit_message_sync, (message,))
+
+    def _send_qbit_message_sync(self, message):
+        """
+        Send a qBittorrent message to the private chat
+
+        Args:
+            message: Message text to send to the private chat
+        """
+        try:
+            params = {**self._qbit_base, 'text': message}
+
+            self._post_with_retry(self.send_message_url, params)
+
+            logger.debug("qBittorrent message sent to Telegram: %.100s...", message)
+            
+        except requests.RequestException as e:
+            logger.error(f"Error sending qBittorrent message to Telegram: {e}")
+    
+    def send_action_results(self, del_actions, no_del_actions):
+        """
+        Send deletion action results
+        
+        Args:
+            del_actions: List of successful deletion actions
+            no_del_actions: List of failed or skipped deletion actions
+        """
+        KEY_ACT_DEL = _KEY_ACT_DEL
+        KEY_ACT_NODELETE = _KEY_ACT_NODELETE
+
+        if del_actions or no_del_actions:
+            qbit_texts = self.texts['qbittorrent']
+            parts = [f"{qbit_texts['deletion_results']}\n\n"]
+
+            if del_actions:
+                # Pre-filter so the formatting pass only sees relevant items
+                del_items = [a for a in del_actions if a and a.get('action') == KEY_ACT_DEL]
+                parts.append(f"{qbit_texts['deleted_section']}\n")
+                # Hash shortened to its first 8 chars
+                parts.extend(
+                    f"   · {a.get('name', 'Unknown torrent')} ({a.get('hash', '')[:8]}...)\n"
+                    for a in del_items
+                )
+                parts.append("\n")
+
+            if no_del_actions:
+                parts.append(f"{qbit_texts['not_deleted_section']}\n")
+                no_del_items = [a for a in no_del_actions
+                                if a and a.get('action') == KEY_ACT_NODELETE]
+
+                # Group by reason for better readability
+                reasons = defaultdict(list)
+                for action in no_del_items:
+                    torrent_hash = action.get('hash', '')[:8] if action.get('hash') else 'no-hash'
+                    reasons[action.get('reason', 'Unknown reason')].append(
+                        f"{action.get('name', 'Unknown torrent')} ({torrent_hash}...)"
+                    )
+
+                for reason, torrents in reasons.items():
+                    parts.append(f"   · <b>{reason}:</b>\n")
+                    for torrent in torrents:
+                        parts.append(f"     - {torrent}\n")
+                    parts.append("\n")
+
+            self.send_qbit_message("".join(parts))
+
+# Compatibility functions to maintain the previous interface
+
+# Lazily-created notifier shared by res_actions_send, so repeated calls reuse
+# the same session and parsed texts
+_NOTIFIER = None
+
+def res_actions_send(res_actions_del, res_actions_no_del):
+    """
+    Compatibility function for action results
+
+    Args:
+        res_actions_del: List of successful deletion actions
+        res_actions_no_del: List of failed or skipped deletion actions
+    """
+    global _NOTIFIER
+    if _NOTIFIER is None:
+        from app.flask_app import app_config
+        _NOTIFIER = TelegramNotifier(app_config)
+    _NOTIFIER.send_action_results(res_actions_del, res_actions_no_del)
@@ -0,0 +1,146 @@
+"""
+TMDb Title Cache
+
+This module provides a small disk-backed cache for TMDb localized titles.
+Titles are effectively immutable for months, so webhook processing should
+not pay an HTTPS round-trip for a tmdb_id it has already resolved — even
+across process restarts.
+
+Classes:
+    TMDbTitleCache: SQLite-backed cache with an in-memory hot layer
+
+The cache lives next to the rest of the runtime state in config/ and keys
+entries by (media_type, tmdb_id, language) with a 7-day TTL.
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from app.logger import logger
+
+# Cache database lives alongside config.json and the logs
+_DB_PATH = Path(__file__).resolve().parent.parent / 'config' / 'tmdb_cache.db'
+
+# Titles are effectively static; refresh weekly
+_TTL_SECONDS = 7 * 86400
+
+
+class TMDbTitleCache:
+    """
+    Disk-backed cache for TMDb localized titles with an in-memory hot layer
+
+    Lookups first hit a process-local dict, then the SQLite table, and only
+    miss to the network when neither layer has a fresh entry. All operations
+    are thread-safe so concurrent title prefetches can share the cache.
+
+    Attributes:
+        db_path: Path to the SQLite database file
+        ttl: Entry lifetime in seconds
+    """
+
+    def __init__(self, db_path=_DB_PATH, ttl=_TTL_SECONDS):
+        """
+        Initialize the cache and create the backing table if needed
+
+        Args:
+            db_path: Path to the SQLite database file
+            ttl (int): Entry lifetime in seconds
+        """
+        self.db_path = db_path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._mem = {}  # (media_type, tmdb_id, language) -> (title, fetched_at)
+        self._conn = None
+
+        try:
+            self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS titles ("
+                " media_type TEXT NOT NULL,"
+                " tmdb_id INTEGER NOT NULL,"
+                " language TEXT NOT NULL,"
+                " title TEXT NOT NULL,"
+                " fetched_at REAL NOT NULL,"
+                " PRIMARY KEY (media_type, tmdb_id, language))"
+            )
+            self._conn.commit()
+        except sqlite3.Error as e:
+            # Fall back to memory-only caching if the disk store is unusable
+            logger.warning(f"TMDb cache database unavailable ({e}), using memory only")
+            self._conn = None
+
+    def get(self, media_type, tmdb_id, language):
+        """
+        Look up a cached localized title
+
+        Args:
+            media_type (str): 'movie' or 'tv'.
+            tmdb_id (int): TMDb ID of the media.
+            language (str): TMDb language code the title was fetched for.
+
+        Returns:
+            str or None: The cached title, or None on miss/expiry.
+        """
+        key = (media_type, tmdb_id, language)
+        now = time.time()
+
+        with self._lock:
+            entry = self._mem.get(key)
+            if entry is not None and now - entry[1] < self.ttl:
+                return entry[0]
+
+            if self._conn is None:
+                return None
+
+            try:
+                row = self._conn.execute(
+                    "SELECT title, fetched_at FROM titles"
+                    " WHERE media_type = ? AND tmdb_id = ? AND language = ?",
+                    key
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.debug(f"TMDb cache read failed: {e}")
+                return None
+
+        if row is None or now - row[1] >= self.ttl:
+            return None
+
+        with self._lock:
+            self._mem[key] = (row[0], row[1])
+        return row[0]
+
+    def set(self, media_type, tmdb_id, language, title):
+        """
+        Store a localized title in both cache layers
+
+        Args:
+            media_type (str): 'movie' or 'tv'.
+            tmdb_id (int): TMDb ID of the media.
+            language (str): TMDb language code the title was fetched for.
+            title (str): Localized title to store.
+        """
+        key = (media_type, tmdb_id, language)
+        now = time.time()
+
+        with self._lock:
+            self._mem[key] = (title, now)
+
+            if self._conn is None:
+                return
+
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO titles"
+                    " (media_type, tmdb_id, language, title, fetched_at)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (media_type, tmdb_id, language, title, now)
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.debug(f"TMDb cache write failed: {e}")
+
+
+# Shared process-wide cache instance
+title_cache = TMDbTitleCache()
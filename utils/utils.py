@@ -20,19 +20,35 @@ import sys
 import socket
 import urllib.parse
 from datetime import datetime
+from functools import lru_cache
 from app.logger import logger
 
+# psutil enumerates interfaces straight from the kernel, skipping the DNS
+# lookup gethostbyname_ex can trigger; fall back to the socket module if
+# it is not installed
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+# 1 GB = 1024^3 bytes; multiply by the inverse instead of dividing per call
+_INV_GIB = 1.0 / (1024 ** 3)
+
+@lru_cache(maxsize=1024)
 def bytes_to_gb(bytes_value):
     """
     Convert bytes to gigabytes
-    
+
     Args:
         bytes_value (int): Size in bytes to convert
-        
+
     Returns:
         float: Size in gigabytes rounded to 2 decimal places
     """
-    return round(bytes_value / (1024 ** 3), 2)  # 1 GB = 1024^3 bytes
+    # Sizes repeat a lot (episodes of the same show), hence the cache;
+    # add-a-half rounding avoids the slower round(x, 2) call
+    return int(bytes_value * _INV_GIB * 100 + 0.5) / 100.0
 
 def exit_with_error(message):
     """
@@ -45,39 +61,63 @@ def exit_with_error(message):
     logger.critical('Critical error, exiting...')
     sys.exit(1)
 
+@lru_cache(maxsize=1)
 def find_my_local_ip():
     """
     Find the local IP address of this machine
-    
+
+    Cached for the process lifetime; use invalidate_ip_cache() if the
+    network configuration changes at runtime.
+
     Returns:
         str: Local IP address as a string
-        
+
     Note:
         Uses a connection to Google's DNS server (8.8.8.8) to determine
         the local IP address that would be used for external connections.
+        No packet is actually sent: connecting a UDP socket only resolves
+        the route and source address.
     """
-    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-    s.connect(("8.8.8.8", 80))
-    add = s.getsockname()[0]
-    s.close()
-    return add
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        s.setblocking(False)
+        try:
+            s.connect(("8.8.8.8", 80))
+            return s.getsockname()[0]
+        except OSError:
+            return "127.0.0.1"
 
+@lru_cache(maxsize=1)
 def get_all_local_ips():
     """
     Get all local IP addresses available on this machine
-    
+
+    Cached for the process lifetime; use invalidate_ip_cache() if the
+    network configuration changes at runtime.
+
     Returns:
-        list: List of all local IP addresses as strings
-        
+        tuple: All local IP addresses as strings, sorted
+
     Note:
         Returns all network interfaces that have an assigned IP address,
         including localhost, local network interfaces, and external interfaces.
     """
+    if PSUTIL_AVAILABLE:
+        local_ips = {
+            addr.address
+            for addrs in psutil.net_if_addrs().values()
+            for addr in addrs
+            if addr.family == socket.AF_INET
+            and not addr.address.startswith('169.254')  # Skip link-local addresses
+            and addr.address != '0.0.0.0'
+        }
+        local_ips.add('127.0.0.1')
+        return tuple(sorted(local_ips))
+
     local_ips = []
-    
+
     # Add localhost
     local_ips.append('127.0.0.1')
-    
+
     # Get hostname and all associated IPs
     try:
         hostname = socket.gethostname()
@@ -106,8 +146,14 @@ def get_all_local_ips():
         except socket.error:
             continue
     
-    return sorted(list(set(valid_ips)))  # Remove duplicates and sort
+    return tuple(sorted(set(valid_ips)))  # Remove duplicates and sort
 
+def invalidate_ip_cache():
+    """Forget the cached local IPs (e.g. after a config reload)"""
+    find_my_local_ip.cache_clear()
+    get_all_local_ips.cache_clear()
+
+@lru_cache(maxsize=4096)
 def truncate_date(date_str):
     """
     Truncate datetime to hour precision, ignoring minutes and seconds
@@ -117,19 +163,26 @@ def truncate_date(date_str):
     
     Args:
         date_str (str): Date string in ISO format ("%Y-%m-%dT%H:%M:%SZ")
-        
+
     Returns:
         datetime: Datetime object with minutes and seconds set to 0
     """
-    return datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%SZ").replace(minute=0, second=0)
+    # The format is fixed, so slice the fields directly instead of paying
+    # strptime's format parsing; skipping minutes/seconds truncates for free.
+    # Cached because bulk imports share the same hour stamp across episodes.
+    return datetime(int(date_str[0:4]), int(date_str[5:7]),
+                    int(date_str[8:10]), int(date_str[11:13]))
 
+@lru_cache(maxsize=2048)
 def clean_title(title):
     """
     URL-encode a title string for safe use in URLs
-    
+
+    Cached: bulk imports encode the same series/movie title once per item.
+
     Args:
         title (str): Title string to encode
-        
+
     Returns:
         str: URL-encoded title string
     """